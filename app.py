@@ -1,12 +1,28 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response
 from github import Github, GithubException
 import os
+import copy
+import hmac
+import hashlib
 from dotenv import load_dotenv
 import json
+import sqlite3
 from datetime import datetime, timedelta
 import re
+import math
+import heapq
 import time
-from supabase import create_client, Client
+from urllib.parse import quote
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발 환경
+    fcntl = None
 
 # 로컬 개발 환경 지원
 if os.path.exists('.env'):
@@ -41,40 +57,219 @@ else:
 print("=" * 60 + "\n")
 
 # GitHub 연결
+# 클라이언트 생성만 하고 네트워크 확인은 첫 요청 이후 백그라운드에서 수행
 if GITHUB_TOKEN:
-    try:
-        g = Github(GITHUB_TOKEN)
-        user = g.get_user()
-        print(f"✓ GitHub 연결 성공: {user.login}\n")
-    except Exception as e:
-        print(f"✗ GitHub 연결 실패: {str(e)}\n")
-        g = None
+    g = Github(GITHUB_TOKEN)
 else:
     g = None
     print("✗ GitHub 토큰이 없어서 연결할 수 없습니다\n")
 
+# GitHub 웹훅 서명 검증용 시크릿
+GITHUB_WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')
+
 # Supabase 설정
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
 
-if SUPABASE_URL and SUPABASE_KEY:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+class LazyClient:
+    """처음 사용할 때 클라이언트를 만드는 지연 초기화 래퍼
+
+    설정이 없으면 False 로 평가되므로 기존 `if supabase:` 분기를 그대로 사용 가능
+    """
+
+    def __init__(self, factory, enabled):
+        self._factory = factory
+        self._enabled = enabled
+        self._client = None
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return self._enabled
+
+    def get(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+def create_supabase_client():
+    """supabase 패키지 import 와 클라이언트 생성 (수백 ms 소요)"""
+    from supabase import create_client
+    client = create_client(SUPABASE_URL, SUPABASE_KEY)
     print(f"\n{'='*60}")
     print("[INIT] Supabase 연결 확인")
     print(f"  URL: {SUPABASE_URL[:30]}...")
     print(f"{'='*60}\n")
-else:
-    supabase = None
+    return client
+
+
+supabase = LazyClient(create_supabase_client, bool(SUPABASE_URL and SUPABASE_KEY))
+if not supabase:
     print("[WARNING] Supabase 환경 변수 없음")
 
+# 외부 서비스 상태 (백그라운드 헬스 체크 결과)
+client_status = {
+    'github': 'disabled' if not g else 'pending',
+    'supabase': 'disabled' if not supabase else 'pending',
+    'started': False,
+    'lock': threading.Lock(),
+}
+
+
+def check_client_health():
+    """GitHub 인증 확인과 Supabase 클라이언트 생성 (백그라운드 스레드)"""
+    global g
+
+    if g:
+        try:
+            login = g.get_user().login
+            client_status['github'] = 'ok'
+            print(f"✓ GitHub 연결 성공: {login}\n")
+        except GithubException as e:
+            client_status['github'] = f"error: {e.status}"
+            print(f"✗ GitHub 연결 실패: {str(e)}\n")
+            if e.status == 401:
+                g = None
+        except Exception as e:
+            client_status['github'] = f"error: {str(e)}"
+            print(f"✗ GitHub 연결 실패: {str(e)}\n")
+
+    if supabase:
+        try:
+            supabase.get()
+            client_status['supabase'] = 'ok'
+        except Exception as e:
+            client_status['supabase'] = f"error: {str(e)}"
+            print(f"[ERROR] Supabase 클라이언트 생성 실패: {str(e)}")
+
+
+def start_client_health_checks():
+    """헬스 체크 스레드 시작 (프로세스당 한 번)"""
+    with client_status['lock']:
+        if client_status['started']:
+            return
+        client_status['started'] = True
+    threading.Thread(target=check_client_health, name='client-health', daemon=True).start()
+
 QUIZ_DATA_FILE = 'quiz_results.json'
+# Supabase 가 없을 때 쓰는 로컬 퀴즈 저장소 (SQLite WAL, 여러 워커가 동시에 써도 안전)
+QUIZ_DB_FILE = os.getenv('QUIZ_DB_FILE', 'quiz_results.db')
+GITHUB_VALIDATOR_FILE = os.getenv('GITHUB_VALIDATOR_FILE', 'github_validators.json')
+# 같은 호스트의 워커들이 공유하는 제출 현황 스냅샷
+SUBMISSION_SNAPSHOT_FILE = os.getenv('SUBMISSION_SNAPSHOT_FILE', 'submission_snapshot.json')
 
 cache = {
     'submissions': None,
     'last_updated': 0,
-    'cache_duration': 300
+    'scanned_at': 0,
+    'cache_duration': int(os.getenv('SUBMISSION_REFRESH_INTERVAL', '300')),
+    'version': 0,
+    'last_error': None,
+    'snapshot_mtime': None,
+    'repo_markers': {},
+    'last_attempt': 0,
+    'scan_failures': 0,
+    # submissions 와 version 을 함께 바꾸고 함께 읽기 위한 잠금
+    'lock': threading.Lock(),
+}
+
+# 백그라운드 갱신 워커 / 진행 중인 재빌드 상태 (single-flight)
+refresher_state = {
+    'thread': None,
+    'lock': threading.Lock(),
+    'in_flight': None,
+    'coalesced': 0,
+}
+
+# 스캔 중에 도착해 나중에 적용할 push 이벤트 (웹훅 응답이 스캔을 기다리지 않도록)
+pending_pushes = {
+    'queue': [],
+    'lock': threading.Lock(),
+    'thread': None,
+    'deferred': 0,
+}
+
+# Supabase 데이터 변경 버전 (이 프로세스의 쓰기 API 가 올림)
+data_versions = {
+    'papers': 0,
+}
+
+# 대시보드 집계 캐시 {이름: {'version', 'computed_at', 'data'}}
+# Supabase 기반 집계는 다른 워커의 쓰기를 반영하도록 TTL 도 함께 적용
+aggregate_cache = {}
+AGGREGATE_TTL = int(os.getenv('AGGREGATE_TTL', '60'))
+
+# GitHub 레포 스캔 설정
+# discovery_mode: 'root' = 레포 최상위만 조회, 'tree' = 하위 폴더까지 (레포당 git trees 요청 1회)
+SCAN_CONFIG = {
+    'max_workers': int(os.getenv('GITHUB_SCAN_WORKERS', '8')),
+    'discovery_mode': os.getenv('SUBMISSION_DISCOVERY_MODE', 'root'),
+    # 전체 스캔 실패 시 재시도 간격 (실패할 때마다 두 배, retry_max 로 제한)
+    'retry_base': int(os.getenv('SUBMISSION_RETRY_BASE', '30')),
+    'retry_max': int(os.getenv('SUBMISSION_RETRY_MAX', '900')),
+}
+
+# 퀴즈 완료 write-behind 설정 (켜면 로컬 SQLite 에 먼저 기록하고 Supabase 에는 묶어서 upsert)
+QUIZ_WRITE_BEHIND = {
+    'enabled': os.getenv('QUIZ_WRITE_BEHIND', '0') == '1',
+    'batch_size': int(os.getenv('QUIZ_FLUSH_BATCH', '200')),
+    'interval': float(os.getenv('QUIZ_FLUSH_INTERVAL', '1')),
+    'max_pending': int(os.getenv('QUIZ_WRITE_BEHIND_MAX', '5000')),
+}
+
+# 퀴즈 flush 워커 상태
+quiz_flush_state = {
+    'thread': None,
+    'lock': threading.Lock(),
+    'wakeup': threading.Event(),
+    'flushed': 0,
+    'failures': 0,
+    'last_error': None,
+    'last_flush': None,
+}
+
+# 마지막 스캔의 레포별 소요 시간 / 오류
+scan_stats = {
+    'repo_timings': {},
+    'errors': {},
+    'unchanged': 0,
+    'not_modified': 0,
+    'total_duration': 0,
+    'scanned_at': 0,
+}
+
+# 레포별 ETag / Last-Modified 와 마지막 파일 목록 (GITHUB_VALIDATOR_FILE 에 영속화)
+validator_store = {
+    'entries': None,
+    'dirty': False,
+    'lock': threading.Lock(),
+}
+
+# GitHub 요청 한도 추적 / 사용량 카운터
+# reserve: 이 값 이하로 남으면 새 요청을 보내지 않고 리셋 시각까지 미룸
+# pace_below: 남은 한도가 이 값보다 적으면 리셋 시각까지 요청 간격을 벌림
+rate_budget = {
+    'remaining': None,
+    'limit': None,
+    'reset_at': None,
+    'reserve': int(os.getenv('GITHUB_RATE_RESERVE', '50')),
+    'pace_below': int(os.getenv('GITHUB_RATE_PACE_BELOW', '500')),
+    'requests': 0,
+    'not_modified': 0,
+    'deferred': 0,
+    'paced_seconds': 0.0,
+    'lock': threading.Lock(),
 }
 
+
+class RateLimitExhausted(Exception):
+    """GitHub 요청 한도가 reserve 이하로 떨어져 요청을 미룸"""
+
 # QUIZZES 데이터
 QUIZZES = {
     "ch01": [
@@ -307,6 +502,10 @@ PART2_MEMBERS = [
 
 ]
 
+# 멤버십 확인용 (in 검사를 O(1)로)
+PART1_MEMBER_SET = frozenset(PART1_MEMBERS)
+PART2_MEMBER_SET = frozenset(PART2_MEMBERS)
+
 STUDY_CONFIG = {
     "org_name": "oracleaistudy",
     "book_name": "혼자 공부하는 머신러닝 딥러닝",
@@ -639,154 +838,798 @@ SKILL_AXES_DETAILED = [
     'Git/GitHub'
 ]
 
-def fetch_all_submissions():
-    if not g:
-        print("[ERROR] GitHub 연결 불가능 (토큰 없음)")
-        return {}
+def create_empty_submission_row(person_name):
+    """멤버 한 명의 빈 제출 현황 생성"""
+    row = {
+        'name': person_name,
+        'submissions': {},
+        'total_completed': 0,
+        'chapters': {},
+    }
+    for i in range(1, 11):
+        ch_key = f'ch{i:02d}'
+        row['submissions'][ch_key] = {
+            'completed': False,
+            'url': None,
+            'filename': None
+        }
+        row['chapters'][ch_key] = False
+    return row
+
+def apply_files_to_row(row, files):
+    """(파일명, URL) 목록을 챕터 제출 현황에 반영"""
+    files = list(files)
+    urls = dict(files)
+    classification = classify_chapter_paths([filename for filename, _ in files])
+
+    for ch_key, filename in classification['assignments'].items():
+        if not row['submissions'][ch_key]['completed']:
+            row['submissions'][ch_key] = {
+                'completed': True,
+                'url': urls[filename],
+                'filename': filename
+            }
+            row['chapters'][ch_key] = True
+            row['total_completed'] += 1
+    return row
+
+def load_validator_store():
+    """조건부 요청용 검증자 저장소 로드 (프로세스당 한 번)"""
+    with validator_store['lock']:
+        if validator_store['entries'] is None:
+            entries = {}
+            if os.path.exists(GITHUB_VALIDATOR_FILE):
+                try:
+                    with open(GITHUB_VALIDATOR_FILE, 'r', encoding='utf-8') as f:
+                        entries = json.load(f)
+                except Exception as e:
+                    print(f"[ERROR] 검증자 저장소 로드 실패: {str(e)}")
+            validator_store['entries'] = entries
+        return validator_store['entries']
+
+def save_validator_store():
+    """변경된 검증자 저장소를 임시 파일에 쓴 뒤 교체 (원자적 저장)"""
+    with validator_store['lock']:
+        if not validator_store['dirty'] or validator_store['entries'] is None:
+            return
+        tmp_path = f"{GITHUB_VALIDATOR_FILE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(validator_store['entries'], f, ensure_ascii=False)
+            os.replace(tmp_path, GITHUB_VALIDATOR_FILE)
+            validator_store['dirty'] = False
+        except Exception as e:
+            print(f"[ERROR] 검증자 저장소 저장 실패: {str(e)}")
+
+def update_rate_budget(requester):
+    """PyGithub Requester 가 마지막 응답 헤더에서 읽은 한도 정보를 반영"""
+    remaining, limit = getattr(requester, 'rate_limiting', (-1, -1))
+    if limit < 0:
+        return
+    with rate_budget['lock']:
+        rate_budget['remaining'] = remaining
+        rate_budget['limit'] = limit
+        rate_budget['reset_at'] = getattr(requester, 'rate_limiting_resettime', None)
+
+def acquire_github_request():
+    """요청 한 건을 보내기 전에 한도 확인
+
+    남은 한도가 적으면 리셋 시각까지 간격을 두고 보내고,
+    reserve 이하이면 RateLimitExhausted 를 던져 호출 측이 기존 스냅샷을 쓰도록 함
+    """
+    with rate_budget['lock']:
+        remaining = rate_budget['remaining']
+        reset_at = rate_budget['reset_at'] or 0
+        wait_seconds = reset_at - time.time()
 
-    current_time = time.time()
-    
-    # 캐시 유효기간 내라면 캐시 반환
-    if cache['submissions'] is not None and (current_time - cache['last_updated']) < cache['cache_duration']:
-        return cache['submissions']
-    
+        if remaining is None or wait_seconds <= 0:
+            rate_budget['requests'] += 1
+            return
+
+        if remaining <= rate_budget['reserve']:
+            rate_budget['deferred'] += 1
+            raise RateLimitExhausted(f"남은 한도 {remaining}, {int(wait_seconds)}초 후 리셋")
+
+        delay = 0
+        if remaining < rate_budget['pace_below']:
+            delay = min(2.0, wait_seconds / (remaining - rate_budget['reserve']))
+            rate_budget['paced_seconds'] += delay
+
+        # 동시 요청들이 같은 한도를 중복 사용하지 않도록 미리 차감
+        rate_budget['remaining'] = remaining - 1
+        rate_budget['requests'] += 1
+
+    if delay:
+        time.sleep(delay)
+
+def conditional_get_json(requester, url, store_key, parameters=None):
+    """ETag / Last-Modified 조건부 GET
+
+    304 응답이면 저장된 본문을 그대로 돌려줌 (GitHub 요청 한도 차감 없음)
+    반환값: (JSON 본문, 304 여부)
+    """
+    entries = load_validator_store()
+    entry = entries.get(store_key)
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    acquire_github_request()
+    status, response_headers, output = requester.requestJson('GET', url, parameters, headers)
+    update_rate_budget(requester)
+
+    if status == 304 and entry:
+        with rate_budget['lock']:
+            rate_budget['not_modified'] += 1
+        return entry['body'], True
+
+    data = json.loads(output) if output else None
+    if status >= 400:
+        raise GithubException(status, data, response_headers)
+
+    with validator_store['lock']:
+        entries[store_key] = {
+            'etag': response_headers.get('etag'),
+            'last_modified': response_headers.get('last-modified'),
+            'body': data,
+        }
+        validator_store['dirty'] = True
+
+    return data, False
+
+def list_root_files(repo):
+    """레포 최상위 파일 목록 (contents API 1회)"""
+    contents, not_modified = conditional_get_json(
+        repo.requester, f"{repo.url}/contents/", f"{repo.name}:contents"
+    )
+    files = [f for f in contents if isinstance(f, dict)]
+    ipynb_files = [
+        (f['name'], f['html_url'])
+        for f in files if f['name'].endswith(('.ipynb', '.py'))
+    ]
+    return ipynb_files, not_modified
+
+def list_tree_files(repo):
+    """기본 브랜치 전체 트리의 파일 목록 (git trees API 1회, 폴더 깊이와 무관)"""
+    branch = repo.default_branch
+    tree, not_modified = conditional_get_json(
+        repo.requester,
+        f"{repo.url}/git/trees/{quote(branch, safe='')}",
+        f"{repo.name}:tree",
+        parameters={'recursive': '1'},
+    )
+    if tree.get('truncated'):
+        print(f"[WARNING] {repo.name}: 트리가 너무 커서 일부만 조회됨")
+
+    ipynb_files = [
+        (entry['path'], f"{repo.html_url}/blob/{quote(branch)}/{quote(entry['path'])}")
+        for entry in tree.get('tree', [])
+        if entry.get('type') == 'blob' and entry['path'].endswith(('.ipynb', '.py'))
+    ]
+    return ipynb_files, not_modified
+
+def scan_member_repo(repo):
+    """레포 하나의 제출 파일 목록 조회 (스레드 풀에서 실행)"""
+    started = time.perf_counter()
+    try:
+        if SCAN_CONFIG['discovery_mode'] == 'tree':
+            ipynb_files, not_modified = list_tree_files(repo)
+        else:
+            ipynb_files, not_modified = list_root_files(repo)
+        return ipynb_files, None, time.perf_counter() - started, not_modified
+    except RateLimitExhausted as e:
+        return None, f"rate limit: {e}", time.perf_counter() - started, False
+    except GithubException as e:
+        return None, str(e.status), time.perf_counter() - started, False
+    except Exception as e:
+        return None, str(e), time.perf_counter() - started, False
+
+def scan_member_repos(repos, max_workers=None):
+    """멤버 레포들을 스레드 풀로 동시에 조회
+
+    레포별 오류는 해당 레포에만 기록되고 나머지 결과에는 영향을 주지 않음
+    반환값: {repo_name: [(파일명, URL), ...] 또는 None(실패)}
+    """
+    max_workers = max(1, max_workers or SCAN_CONFIG['max_workers'])
+    started = time.perf_counter()
+    results = {}
+    timings = {}
+    errors = {}
+    not_modified_count = 0
+
+    if repos:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            futures = {executor.submit(scan_member_repo, repo): repo.name for repo in repos}
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                files, error, elapsed, not_modified = future.result()
+                results[repo_name] = files
+                if not_modified:
+                    not_modified_count += 1
+                timings[repo_name] = round(elapsed, 3)
+                if error:
+                    errors[repo_name] = error
+                    print(f"[ERROR] {repo_name}: {error}")
+
+    scan_stats['repo_timings'] = timings
+    scan_stats['errors'] = errors
+    scan_stats['not_modified'] = not_modified_count
+    scan_stats['total_duration'] = round(time.perf_counter() - started, 3)
+    scan_stats['scanned_at'] = time.time()
+
+    if timings:
+        slowest = max(timings, key=timings.get)
+        print(f"[INFO] 레포 {len(timings)}개 스캔 완료: {scan_stats['total_duration']}초 "
+              f"(동시 {max_workers}개, 최장 {slowest} {timings[slowest]}초, "
+              f"변경 없음 {not_modified_count}개, 오류 {len(errors)}개)")
+
+    save_validator_store()
+
+    return results
+
+def get_repo_marker(repo):
+    """레포 변경 감지용 값 (조직 레포 목록에 포함된 pushed_at + 탐색 방식)"""
+    pushed_at = getattr(repo, 'pushed_at', None)
+    if not pushed_at:
+        return None
+    return f"{SCAN_CONFIG['discovery_mode']}:{pushed_at.isoformat()}"
+
+def build_submission_matrix(previous=None, previous_markers=None):
+    """GitHub 스캔으로 제출 현황 생성 (변경된 레포만 다시 조회)
+
+    pushed_at 이 이전 스캔과 같은 레포는 이전 스냅샷의 행을 그대로 사용
+    조회에 실패한 레포는 이전 행을 유지하고 다음 스캔에서 다시 조회
+    조직 접근 자체가 실패하면 None 반환 (기존 스냅샷을 덮어쓰지 않도록)
+    반환값: (submission_matrix, repo_markers) 또는 None
+    """
+    previous = previous or {}
+    previous_markers = previous_markers or {}
     submission_matrix = {}
+    repo_markers = {}
 
     for repo_name, person_name in REPO_NAME_MAPPING.items():
-        submission_matrix[repo_name] = {
-            'name': person_name,
-            'submissions': {},
-            'total_completed': 0,
-            'chapters': {},
-        }
-        for i in range(1, 11):
-            ch_key = f'ch{i:02d}'
-            submission_matrix[repo_name]['submissions'][ch_key] = {
-                'completed': False,
-                'url': None,
-                'filename': None
-            }
-            submission_matrix[repo_name]['chapters'][ch_key] = False
+        submission_matrix[repo_name] = create_empty_submission_row(person_name)
 
     try:
-        org = g.get_organization(STUDY_CONFIG['org_name'])
-        repos = list(org.get_repos())
+        # 조직 레포 목록 조회 (페이지당 요청 1회)
+        acquire_github_request()
+        try:
+            org = g.get_organization(STUDY_CONFIG['org_name'])
+            repos = [repo for repo in org.get_repos() if repo.name in REPO_NAME_MAPPING]
+        finally:
+            update_rate_budget(g.requester)
 
+        changed_repos = []
         for repo in repos:
-            repo_name = repo.name
+            marker = get_repo_marker(repo)
+            repo_markers[repo.name] = marker
+            if marker and repo.name in previous and previous_markers.get(repo.name) == marker:
+                submission_matrix[repo.name] = previous[repo.name]
+            else:
+                changed_repos.append(repo)
 
-            if repo_name in REPO_NAME_MAPPING:
-                try:
-                    contents = repo.get_contents("")
-                    files = [f for f in contents if not isinstance(f, dict)]
-                    ipynb_files = [f for f in files if f.name.endswith(('.ipynb', '.py'))]
-
-                    for file in ipynb_files:
-                        detected_chapter = detect_chapter_from_filename(file.name)
-
-                        if detected_chapter:
-                            ch_key = detected_chapter
-                            if not submission_matrix[repo_name]['submissions'][ch_key]['completed']:
-                                submission_matrix[repo_name]['submissions'][ch_key] = {
-                                    'completed': True,
-                                    'url': file.html_url,
-                                    'filename': file.name
-                                }
-                                submission_matrix[repo_name]['chapters'][ch_key] = True
-                                submission_matrix[repo_name]['total_completed'] += 1
-
-                except GithubException as e:
-                    print(f"[ERROR] {repo_name}: {e.status}")
-                except Exception as e:
-                    print(f"[ERROR] {repo_name}: {str(e)}")
+        scan_results = scan_member_repos(changed_repos)
+        scan_stats['unchanged'] = len(repos) - len(changed_repos)
 
     except Exception as e:
         print(f"[ERROR] 조직 접근 실패: {str(e)}")
+        cache['last_error'] = str(e)
+        return None
+
+    if not previous and scan_results and all(files is None for files in scan_results.values()):
+        # 첫 스캔에서 모든 레포 조회 실패 (한도 소진 등) - 빈 행만 있는 스냅샷은 게시하지 않음
+        cache['last_error'] = '모든 레포 조회 실패'
+        return None
+
+    for repo_name, files in scan_results.items():
+        if files is not None:
+            apply_files_to_row(submission_matrix[repo_name], files)
+        else:
+            repo_markers.pop(repo_name, None)
+            if repo_name in previous:
+                submission_matrix[repo_name] = previous[repo_name]
+
+    cache['last_error'] = None
+    return submission_matrix, repo_markers
+
+def read_shared_snapshot():
+    """다른 워커가 게시한 스냅샷이 더 새로우면 가져옴
+
+    파일이 바뀌지 않았으면 stat 한 번으로 끝남
+    반환값: 새 스냅샷을 가져왔는지 여부
+    """
+    try:
+        mtime = os.stat(SUBMISSION_SNAPSHOT_FILE).st_mtime_ns
+    except OSError:
+        return False
+
+    if mtime == cache['snapshot_mtime']:
+        return False
+
+    try:
+        with open(SUBMISSION_SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except Exception as e:
+        print(f"[ERROR] 공유 스냅샷 로드 실패: {str(e)}")
+        return False
+
+    cache['snapshot_mtime'] = mtime
+    # 스캔 시도 기록은 스냅샷 버전과 무관하게 더 최근 것을 따름 (실패한 스캔도 공유)
+    if snapshot.get('last_attempt', 0) > cache['last_attempt']:
+        cache['last_attempt'] = snapshot['last_attempt']
+        cache['scan_failures'] = snapshot.get('scan_failures', 0)
+
+    if snapshot['submissions'] is None:
+        return False
+    if cache['submissions'] is not None and snapshot['version'] <= cache['version']:
+        return False
+
+    with cache['lock']:
+        cache['submissions'] = snapshot['submissions']
+        cache['last_updated'] = snapshot['published_at']
+        cache['scanned_at'] = snapshot.get('scanned_at', snapshot['published_at'])
+        cache['version'] = snapshot['version']
+        cache['repo_markers'] = snapshot.get('repo_markers', {})
+    return True
+
+def write_shared_snapshot():
+    """현재 스냅샷을 임시 파일에 쓴 뒤 교체 (읽는 쪽은 항상 완전한 파일만 봄)"""
+    tmp_path = f"{SUBMISSION_SNAPSHOT_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': cache['version'],
+                'published_at': cache['last_updated'],
+                'scanned_at': cache['scanned_at'],
+                'submissions': cache['submissions'],
+                'repo_markers': cache['repo_markers'],
+                'last_attempt': cache['last_attempt'],
+                'scan_failures': cache['scan_failures'],
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, SUBMISSION_SNAPSHOT_FILE)
+        cache['snapshot_mtime'] = os.stat(SUBMISSION_SNAPSHOT_FILE).st_mtime_ns
+    except Exception as e:
+        print(f"[ERROR] 공유 스냅샷 저장 실패: {str(e)}")
+
+def acquire_snapshot_lock(blocking=True):
+    """스냅샷 재빌드용 워커 간 잠금 (다른 워커가 스캔 중이면 끝날 때까지 대기)
+
+    blocking=False 이면 기다리지 않고, 이미 잠겨 있으면 False 반환
+    """
+    if fcntl is None:
+        return None
+    lock_file = open(f"{SUBMISSION_SNAPSHOT_FILE}.lock", 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return False
+    return lock_file
+
+def release_snapshot_lock(lock_file):
+    if lock_file is not None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+def publish_submissions(submission_matrix, repo_markers=None):
+    """새 스냅샷을 캐시에 반영하고 다른 워커에 공유
+
+    스냅샷의 행은 여러 버전이 공유하므로 수정할 때는 복사본을 만들어 게시
+    repo_markers 는 전체 스캔 결과에만 있으므로, 있을 때만 전체 스캔 시각(scanned_at)을 갱신
+    """
+    now = time.time()
+    with cache['lock']:
+        cache['submissions'] = submission_matrix
+        if repo_markers is not None:
+            cache['repo_markers'] = repo_markers
+            cache['scanned_at'] = now
+        cache['last_updated'] = now
+        cache['version'] += 1
+    write_shared_snapshot()
+
+def refresh_submissions(force=False):
+    """GitHub을 다시 스캔해 스냅샷 갱신 (실패 시 기존 스냅샷 유지)
+
+    이미 진행 중인 재빌드가 있으면 새로 시작하지 않고 그 결과를 기다림
+    다른 워커가 유효기간 내에 게시한 스냅샷이 있으면 스캔을 생략 (force=True 제외)
+    """
+    with refresher_state['lock']:
+        in_flight = refresher_state['in_flight']
+        if in_flight is None:
+            in_flight = refresher_state['in_flight'] = threading.Event()
+            is_leader = True
+        else:
+            refresher_state['coalesced'] += 1
+            is_leader = False
+
+    if not is_leader:
+        in_flight.wait()
+        return cache['submissions'] if cache['submissions'] is not None else {}
+
+    try:
+        lock_file = acquire_snapshot_lock()
+        try:
+            # 기다리는 동안 다른 워커가 방금 게시했다면 그 스냅샷을 사용
+            read_shared_snapshot()
+            age = get_scan_age()
+            is_due = (age is None or age >= cache['cache_duration']) and time.time() >= get_next_retry_at()
+            if is_due or force:
+                result = build_submission_matrix(cache['submissions'], cache['repo_markers'])
+                cache['last_attempt'] = time.time()
+
+                if result is not None:
+                    cache['scan_failures'] = 0
+                    publish_submissions(*result)
+                else:
+                    # 실패도 공유해야 다른 워커가 바로 다시 스캔하지 않음
+                    cache['scan_failures'] += 1
+                    write_shared_snapshot()
+                    if cache['submissions'] is not None:
+                        print(f"[WARNING] 제출 현황 갱신 실패 ({cache['scan_failures']}회 연속) - 이전 스냅샷 유지")
+        finally:
+            release_snapshot_lock(lock_file)
+    finally:
+        with refresher_state['lock']:
+            refresher_state['in_flight'] = None
+        in_flight.set()
+
+    return cache['submissions'] if cache['submissions'] is not None else {}
+
+def submission_refresher_loop():
+    """주기적으로 제출 현황을 갱신하는 백그라운드 워커
+
+    고정 간격이 아니라 마지막 전체 스캔 시각 + cache_duration 까지 기다림
+    (웹훅 게시는 전체 스캔 주기에 영향을 주지 않음)
+    스캔이 실패했으면 재시도 간격(get_next_retry_at)이 지날 때까지 더 기다림
+    """
+    while True:
+        read_shared_snapshot()
+        wake_at = max(cache['scanned_at'] + cache['cache_duration'], get_next_retry_at())
+        time.sleep(max(1, wake_at - time.time()))
+        try:
+            refresh_submissions()
+        except Exception as e:
+            print(f"[ERROR] 백그라운드 갱신 실패: {str(e)}")
+
+def start_submission_refresher():
+    """백그라운드 갱신 워커 시작 (프로세스당 한 번)"""
+    with refresher_state['lock']:
+        if refresher_state['thread'] is None:
+            thread = threading.Thread(target=submission_refresher_loop, name='submission-refresher', daemon=True)
+            thread.start()
+            refresher_state['thread'] = thread
+
+def get_submissions_age():
+    """현재 스냅샷 생성 후 경과 시간 (초), 스냅샷이 없으면 None"""
+    if cache['submissions'] is None:
+        return None
+    return int(time.time() - cache['last_updated'])
+
+def get_next_retry_at():
+    """연속 실패 횟수에 따른 다음 스캔 가능 시각 (실패가 없으면 0)"""
+    if cache['scan_failures'] == 0:
+        return 0
+    backoff = SCAN_CONFIG['retry_base'] * 2 ** (cache['scan_failures'] - 1)
+    return cache['last_attempt'] + min(backoff, SCAN_CONFIG['retry_max'])
+
+def get_scan_age():
+    """마지막 전체 스캔 후 경과 시간 (초), 스냅샷이 없으면 None"""
+    if cache['submissions'] is None:
+        return None
+    return time.time() - cache['scanned_at']
+
+def get_snapshot_version(submissions):
+    """submissions 가 현재 스냅샷이면 그 버전, 아니면 (이미 새 스냅샷으로 바뀌었으면) None
+
+    스냅샷을 받은 뒤 cache['version'] 을 따로 읽으면 그 사이에 새 스냅샷이 들어와
+    이전 스냅샷으로 만든 집계가 새 버전으로 저장될 수 있으므로 잠금 안에서 같이 확인
+    """
+    with cache['lock']:
+        if submissions is cache['submissions']:
+            return cache['version']
+    return None
+
+def fetch_all_submissions():
+    """마지막으로 성공한 스냅샷을 즉시 반환
+
+    스냅샷이 없을 때만 요청 스레드에서 직접 스캔하고,
+    이후 갱신은 백그라운드 워커가 담당
+    """
+    if not g:
+        print("[ERROR] GitHub 연결 불가능 (토큰 없음)")
+        return {}
+
+    start_submission_refresher()
+    read_shared_snapshot()
 
-    cache['submissions'] = submission_matrix
-    cache['last_updated'] = current_time
+    if cache['submissions'] is None:
+        return refresh_submissions()
 
-    return submission_matrix
+    return cache['submissions']
     
+def verify_github_signature(body, signature_header):
+    """X-Hub-Signature-256 헤더 검증 (시크릿 미설정 시 항상 거부)"""
+    if not GITHUB_WEBHOOK_SECRET or not signature_header:
+        return False
+    expected = 'sha256=' + hmac.new(
+        GITHUB_WEBHOOK_SECRET.encode('utf-8'), body, hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected, signature_header)
+
+def parse_push_event(payload):
+    """push 이벤트에서 최종적으로 추가/삭제된 파일 목록을 추림
+
+    반환값: 적용할 변경 내용, 대상 레포의 기본 브랜치 push 가 아니면 None
+    """
+    repository = payload.get('repository') or {}
+    repo_name = repository.get('name')
+    if repo_name not in REPO_NAME_MAPPING:
+        return None
+
+    default_branch = repository.get('default_branch') or 'main'
+    if payload.get('ref') != f"refs/heads/{default_branch}":
+        return None
+
+    # 커밋 순서대로 적용해 최종 상태만 남김
+    present = {}
+    for commit in payload.get('commits', []):
+        for path in commit.get('added', []) + commit.get('modified', []):
+            present[path] = True
+        for path in commit.get('removed', []):
+            present[path] = False
+
+    def is_candidate(path):
+        if not path.endswith(('.ipynb', '.py')):
+            return False
+        return SCAN_CONFIG['discovery_mode'] == 'tree' or '/' not in path
+
+    html_url = repository.get('html_url') or f"https://github.com/{STUDY_CONFIG['org_name']}/{repo_name}"
+    return {
+        'repo_name': repo_name,
+        'added': [
+            (path, f"{html_url}/blob/{quote(default_branch)}/{quote(path)}")
+            for path, exists in present.items() if exists and is_candidate(path)
+        ],
+        'removed': {path for path, exists in present.items() if not exists},
+    }
+
+def apply_push_changes(changes):
+    """push 변경 내용으로 해당 멤버의 행만 갱신 (스냅샷 잠금을 잡은 상태에서 호출)
+
+    삭제된 파일이 챕터로 인정된 파일이면 그 챕터를 미완료로 되돌리고,
+    pushed_at 이 바뀌었으므로 다음 백그라운드 스캔에서 이 레포만 다시 조회해 보정
+    아직 스냅샷이 없으면 아무것도 하지 않음 (이 멤버 행만 있는 스냅샷을 게시하면
+    다른 워커까지 그 스냅샷을 쓰게 되므로, 첫 전체 스캔이 이 push 도 반영하도록 둠)
+    반환값: 갱신된 레포 이름, 스냅샷이 없으면 None
+    """
+    repo_name = changes['repo_name']
+    read_shared_snapshot()
+    current = cache['submissions']
+    if current is None:
+        print(f"[INFO] 스냅샷이 아직 없어 push 이벤트 무시: {repo_name}")
+        return None
+
+    if repo_name in current:
+        row = copy.deepcopy(current[repo_name])
+    else:
+        row = create_empty_submission_row(REPO_NAME_MAPPING[repo_name])
+
+    for ch_key, submission in row['submissions'].items():
+        if submission['completed'] and submission['filename'] in changes['removed']:
+            row['submissions'][ch_key] = {'completed': False, 'url': None, 'filename': None}
+            row['chapters'][ch_key] = False
+            row['total_completed'] -= 1
+
+    apply_files_to_row(row, changes['added'])
+
+    submission_matrix = dict(current)
+    submission_matrix[repo_name] = row
+    publish_submissions(submission_matrix)
+    return repo_name
+
+def drain_pending_pushes():
+    """전체 스캔이 끝나 잠금이 풀리면 밀린 push 이벤트를 도착 순서대로 적용"""
+    lock_file = acquire_snapshot_lock()
+    try:
+        while True:
+            with pending_pushes['lock']:
+                if not pending_pushes['queue']:
+                    pending_pushes['thread'] = None
+                    return
+                changes = pending_pushes['queue'].pop(0)
+            try:
+                apply_push_changes(changes)
+            except Exception as e:
+                print(f"[ERROR] 지연된 push 이벤트 적용 실패 ({changes['repo_name']}): {str(e)}")
+    finally:
+        release_snapshot_lock(lock_file)
+
+def apply_push_event(payload):
+    """push 이벤트를 반영 (조직 전체 재스캔 없음)
+
+    다른 워커가 전체 스캔 중이라 잠금을 바로 잡을 수 없으면 기다리지 않고
+    큐에 넣은 뒤 스캔이 끝나면 백그라운드에서 적용 (GitHub 웹훅 응답 제한 시간 10초)
+    반환값: (결과, 레포 이름) - 결과는 'applied' / 'deferred' / 'snapshot' / 'repository'
+    """
+    changes = parse_push_event(payload)
+    if changes is None:
+        return 'repository', None
+
+    lock_file = acquire_snapshot_lock(blocking=False)
+    if lock_file is False:
+        with pending_pushes['lock']:
+            pending_pushes['queue'].append(changes)
+            pending_pushes['deferred'] += 1
+            if pending_pushes['thread'] is None:
+                pending_pushes['thread'] = threading.Thread(target=drain_pending_pushes, daemon=True)
+                pending_pushes['thread'].start()
+        return 'deferred', changes['repo_name']
+
+    try:
+        repo_name = apply_push_changes(changes)
+    finally:
+        release_snapshot_lock(lock_file)
+
+    return ('applied' if repo_name else 'snapshot'), changes['repo_name']
+
+# 챕터 감지 패턴 (우선순위 순서)
+CHAPTER_PATTERNS = [
+    (r'ch[_\-\s]?(\d{2})', '형식: ch01'),
+    (r'chapter[_\-\s]?(\d{2})', '형식: chapter01'),
+    (r'ch[_\-\s]?([1-9])(?![0-9])', '형식: ch1'),
+    (r'chapter[_\-\s]?([1-9])(?![0-9])', '형식: chapter1'),
+    (r'chap[_\-\s]?(\d{2})', '형식: chap01'),
+    (r'chap[_\-\s]?([1-9])(?![0-9])', '형식: chap1'),
+    (r'week[_\-\s]?(\d{2})', '형식: week01'),
+    (r'week[_\-\s]?([1-9])(?![0-9])', '형식: week1'),
+    (r'^(\d{1,2})[_\-\s]', '형식: 01-'),
+    (r'^(\d{1,2})\.', '형식: 01.'),
+]
+
+# 우선순위 순서대로 미리 컴파일 (첫 번째로 유효한 챕터를 찾으면 바로 종료)
+COMPILED_CHAPTER_PATTERNS = [re.compile(pattern) for pattern, _ in CHAPTER_PATTERNS]
+# 어느 패턴에도 걸릴 수 없는 파일명을 빠르게 거르기 위한 결합 사전 검사
+CHAPTER_HINT = re.compile(r'ch|week|^\d')
+HANGUL_CHARS = re.compile('[\uac00-\ud7a3]+')
+
+@lru_cache(maxsize=4096)
 def detect_chapter_from_filename(filename):
     """파일명에서 챕터 번호를 감지"""
     
     filename = filename.split('/')[-1]
-    
-    filename_lower = filename.lower()
-    filename_clean = ''.join(
-        c for c in filename_lower 
-        if not ('\uac00' <= c <= '\ud7a3')
-    )
-    
-    patterns = [
-        (r'ch[_\-\s]?(\d{2})', '형식: ch01'),
-        (r'chapter[_\-\s]?(\d{2})', '형식: chapter01'),
-        (r'ch[_\-\s]?([1-9])(?![0-9])', '형식: ch1'),
-        (r'chapter[_\-\s]?([1-9])(?![0-9])', '형식: chapter1'),
-        (r'chap[_\-\s]?(\d{2})', '형식: chap01'),
-        (r'chap[_\-\s]?([1-9])(?![0-9])', '형식: chap1'),
-        (r'week[_\-\s]?(\d{2})', '형식: week01'),
-        (r'week[_\-\s]?([1-9])(?![0-9])', '형식: week1'),
-        (r'^(\d{1,2})[_\-\s]', '형식: 01-'),
-        (r'^(\d{1,2})\.', '형식: 01.'),
-    ]
-    
-    for pattern, pattern_desc in patterns:
-        match = re.search(pattern, filename_clean)
+    filename_clean = HANGUL_CHARS.sub('', filename.lower())
+
+    if not CHAPTER_HINT.search(filename_clean):
+        return None
+
+    for pattern in COMPILED_CHAPTER_PATTERNS:
+        match = pattern.search(filename_clean)
         if match:
             num = int(match.group(1))
             if 1 <= num <= 10:
                 return f'ch{num:02d}'
     
     return None
+def classify_chapter_paths(paths):
+    """파일 경로 목록을 한 번에 챕터별로 분류
+
+    같은 파일명은 배치 안에서 한 번만 감지
+    반환값:
+        assignments: {챕터: 경로} - 챕터마다 처음 나온 파일 (스캔 시 제출로 인정되는 파일)
+        conflicts: {챕터: [경로, ...]} - 같은 챕터로 감지된 파일이 둘 이상인 경우 전체 목록
+        unmatched: 챕터를 찾지 못한 경로 목록
+    """
+    detected_by_name = {}
+    by_chapter = {}
+    unmatched = []
+
+    for path in paths:
+        name = path.rsplit('/', 1)[-1]
+        ch_key = detected_by_name.get(name, False)
+        if ch_key is False:
+            ch_key = detected_by_name[name] = detect_chapter_from_filename(name)
+
+        if ch_key:
+            by_chapter.setdefault(ch_key, []).append(path)
+        else:
+            unmatched.append(path)
+
+    return {
+        'assignments': {ch_key: matched[0] for ch_key, matched in sorted(by_chapter.items())},
+        'conflicts': {ch_key: matched for ch_key, matched in sorted(by_chapter.items()) if len(matched) > 1},
+        'unmatched': unmatched,
+    }
+
 # =============================
 # 업데이트된 함수들
 # =============================
 
+# 스킬 점수 계산용 행렬 (DETAILED_SKILL_MAPPING 에서 한 번만 생성)
+SKILL_CHAPTER_KEYS = [f'ch{i:02d}' for i in range(1, 11)]
+# 챕터 × 스킬 가중치 행렬
+SKILL_WEIGHT_MATRIX = [
+    [DETAILED_SKILL_MAPPING.get(ch_key, {}).get(skill, 0) for skill in SKILL_AXES_DETAILED]
+    for ch_key in SKILL_CHAPTER_KEYS
+]
+# 정규화 기준: 모든 챕터를 완료했을 때의 스킬별 점수 (가중치 행렬의 열 합계)
+SKILL_MAX_SCORES = [
+    sum(weights[skill_index] for weights in SKILL_WEIGHT_MATRIX)
+    for skill_index in range(len(SKILL_AXES_DETAILED))
+]
+
+# 스냅샷 버전별 전체 멤버 스킬 점수
+skill_score_cache = {
+    'version': None,
+    'scores': {},
+}
+
+def build_completion_matrix(submissions):
+    """멤버 × 챕터 완료 여부 행렬 (행 순서는 submissions 순서)"""
+    return [
+        [1 if data['submissions'][ch_key]['completed'] else 0 for ch_key in SKILL_CHAPTER_KEYS]
+        for data in submissions.values()
+    ]
+
+def compute_skill_score_matrix(completion_matrix):
+    """완료 행렬 × 가중치 행렬 후 스킬별 최대 점수로 정규화 (0-100)"""
+    skill_count = len(SKILL_AXES_DETAILED)
+    normalized = []
+    for completed in completion_matrix:
+        raw = [0] * skill_count
+        for ch_index, done in enumerate(completed):
+            if done:
+                weights = SKILL_WEIGHT_MATRIX[ch_index]
+                for skill_index in range(skill_count):
+                    raw[skill_index] += weights[skill_index]
+        normalized.append([
+            min(100, (raw[skill_index] / SKILL_MAX_SCORES[skill_index]) * 100)
+            if SKILL_MAX_SCORES[skill_index] > 0 else 0
+            for skill_index in range(skill_count)
+        ])
+    return normalized
+
+def get_all_skill_scores(submissions):
+    """전체 멤버 스킬 점수 {repo_name: {스킬: 점수}} (현재 스냅샷이면 버전별로 캐시)"""
+    version = get_snapshot_version(submissions)
+    if version is not None and skill_score_cache['version'] == version:
+        return skill_score_cache['scores']
+
+    score_matrix = compute_skill_score_matrix(build_completion_matrix(submissions))
+    scores = {
+        repo_name: dict(zip(SKILL_AXES_DETAILED, row))
+        for repo_name, row in zip(submissions.keys(), score_matrix)
+    }
+
+    if version is not None:
+        skill_score_cache['version'] = version
+        skill_score_cache['scores'] = scores
+    return scores
+
 def calculate_skill_scores_detailed(submissions_data):
     """
     상세 챕터 구조를 기반으로 스킬맵 점수 계산
     """
-    skill_scores = {skill: 0 for skill in SKILL_AXES_DETAILED}
-    
-    for chapter_key, submission in submissions_data['submissions'].items():
-        if submission['completed']:
-            if chapter_key in DETAILED_SKILL_MAPPING:
-                for skill, points in DETAILED_SKILL_MAPPING[chapter_key].items():
-                    if skill in skill_scores:
-                        skill_scores[skill] += points
-    
-    # 정규화 (0-100)
-    max_scores = {
-        '데이터 전처리': 45,
-        '머신러닝 기초': 85,
-        '모델 평가': 50,
-        '비지도 학습': 25,
-        '딥러닝 기본': 60,
-        'CNN': 25,
-        'Git/GitHub': 11
-    }
-    
-    normalized_scores = {}
-    for skill in SKILL_AXES_DETAILED:
-        if skill in max_scores and max_scores[skill] > 0:
-            normalized_scores[skill] = min(100, (skill_scores[skill] / max_scores[skill]) * 100)
-        else:
-            normalized_scores[skill] = 0
-    
-    return normalized_scores
+    score_matrix = compute_skill_score_matrix(build_completion_matrix({'member': submissions_data}))
+    return dict(zip(SKILL_AXES_DETAILED, score_matrix[0]))
 
-def get_detailed_learning_profile(repo_name, submissions_data):
+def get_detailed_learning_profile(repo_name, submissions_data, skill_scores=None):
     """
     상세 학습 프로필 생성 (섹션별 정보 포함)
+    skill_scores 를 주면 (get_all_skill_scores 캐시) 다시 계산하지 않음
     """
+    if skill_scores is None:
+        skill_scores = calculate_skill_scores_detailed(submissions_data)
+
     profile = {
         'name': submissions_data['name'],
         'repo_name': repo_name,
         'github_url': f"https://github.com/{STUDY_CONFIG['org_name']}/{repo_name}",
         'chapters': [],
-        'skill_scores': calculate_skill_scores_detailed(submissions_data),
+        'skill_scores': skill_scores,
         'total_chapters': submissions_data['total_completed'],
         'completion_rate': round((submissions_data['total_completed'] / 10) * 100),
         'learned_concepts': [],
@@ -900,180 +1743,192 @@ def get_user_projects(user_name):
     except Exception as e:
         print(f"[ERROR] 프로젝트 조회 실패: {e}")
         return []
-# =========================
-# 라우트 정의
-# =========================
+def parse_chapter_range(chapter_str):
+    """
+    '1-2' -> [1, 2]
+    '6' -> [6]
+    '3-4' -> [3, 4]
+    """
+    try:
+        if '-' in chapter_str:
+            start, end = chapter_str.split('-')
+            return list(range(int(start), int(end) + 1))
+        else:
+            return [int(chapter_str)]
+    except:
+        return [1]
+
+def get_cached_aggregate(name, version, compute, ttl=None):
+    """버전(과 TTL)이 같으면 저장된 집계를, 아니면 새로 계산해 저장 (버전이 None 이면 캐시하지 않음)"""
+    if version is None:
+        return compute()
+
+    entry = aggregate_cache.get(name)
+    now = time.time()
+    if entry and entry['version'] == version and (ttl is None or now - entry['computed_at'] < ttl):
+        return entry['data']
+
+    data = compute()
+    aggregate_cache[name] = {'version': version, 'computed_at': now, 'data': data}
+    return data
+
+def count_part_submitted(submissions, members, chapters):
+    """범위 내 모든 챕터를 완료한 멤버 수"""
+    ch_keys = [f'ch{ch_num:02d}' for ch_num in chapters]
+    return sum(
+        1 for repo_name in members
+        if repo_name in submissions
+        and all(submissions[repo_name]['submissions'][ch_key]['completed'] for ch_key in ch_keys)
+    )
 
-@app.route('/')
-def index():
-    """간소화된 메인 대시보드"""
-    submissions = fetch_all_submissions()
+def compute_submission_aggregates(submissions):
+    """제출 현황 스냅샷 기반 대시보드 집계"""
     members_count = len(REPO_NAME_MAPPING)
-    
+
     # PART별 분리
-    part1_submissions = {k: v for k, v in submissions.items() if k in PART1_MEMBERS}
-    part2_submissions = {k: v for k, v in submissions.items() if k in PART2_MEMBERS}
-    
+    part1_submissions = {k: v for k, v in submissions.items() if k in PART1_MEMBER_SET}
+    part2_submissions = {k: v for k, v in submissions.items() if k in PART2_MEMBER_SET}
+
     # 현재 진행 챕터 (범위 지원)
     part1_current_str = STUDY_CONFIG.get('part1_current_chapter', '7')
     part2_current_str = STUDY_CONFIG.get('part2_current_chapter', '3')
-    
-    # 챕터 범위를 리스트로 변환하는 함수
-    def parse_chapter_range(chapter_str):
-        """
-        '1-2' -> [1, 2]
-        '6' -> [6]
-        '3-4' -> [3, 4]
-        """
-        try:
-            if '-' in chapter_str:
-                start, end = chapter_str.split('-')
-                return list(range(int(start), int(end) + 1))
-            else:
-                return [int(chapter_str)]
-        except:
-            return [1]
-    
     part1_chapters = parse_chapter_range(part1_current_str)
     part2_chapters = parse_chapter_range(part2_current_str)
-    
-    # 마지막 챕터 번호 (제출률 계산용)
-    part1_current_ch = max(part1_chapters)
-    part2_current_ch = max(part2_chapters)
-    
-    # PART1 과제 제출 상태 (범위 내 모든 챕터 완료 여부)
-    part1_submitted = 0
-    for repo_name in PART1_MEMBERS:
-        if repo_name in submissions:
-            # 해당 범위의 모든 챕터를 완료했는지 확인
-            all_completed = True
-            for ch_num in part1_chapters:
-                ch_key = f'ch{ch_num:02d}'
-                if not submissions[repo_name]['submissions'][ch_key]['completed']:
-                    all_completed = False
-                    break
-            
-            if all_completed:
-                part1_submitted += 1
-    
+
+    # PART별 과제 제출 상태 (범위 내 모든 챕터 완료 여부)
+    part1_submitted = count_part_submitted(submissions, PART1_MEMBERS, part1_chapters)
     part1_submit_rate = round((part1_submitted / len(PART1_MEMBERS)) * 100) if PART1_MEMBERS else 0
-    part1_not_submit_rate = 100 - part1_submit_rate
-    
-    # PART2 과제 제출 상태 (범위 내 모든 챕터 완료 여부)
-    part2_submitted = 0
-    for repo_name in PART2_MEMBERS:
-        if repo_name in submissions:
-            # 해당 범위의 모든 챕터를 완료했는지 확인
-            all_completed = True
-            for ch_num in part2_chapters:
-                ch_key = f'ch{ch_num:02d}'
-                if not submissions[repo_name]['submissions'][ch_key]['completed']:
-                    all_completed = False
-                    break
-            
-            if all_completed:
-                part2_submitted += 1
-    
+
+    part2_submitted = count_part_submitted(submissions, PART2_MEMBERS, part2_chapters)
     part2_submit_rate = round((part2_submitted / len(PART2_MEMBERS)) * 100) if PART2_MEMBERS else 0
-    part2_not_submit_rate = 100 - part2_submit_rate
-    
+
     # 전체 진행률 계산
     total_completed = sum(data['total_completed'] for data in submissions.values())
     total_possible = members_count * 10
     avg_progress = round((total_completed / total_possible) * 100) if total_possible > 0 else 0
-    
+
     # PART별 TOP 3 완료자
     part1_top_users = sorted(
         part1_submissions.items(),
         key=lambda x: x[1]['total_completed'],
         reverse=True
     )[:3]
-    
+
     part2_top_users = sorted(
         part2_submissions.items(),
         key=lambda x: x[1]['total_completed'],
         reverse=True
     )[:3]
-    
+
     # PART별 평균 진행률
-    part1_completed = sum(
-        submissions[k]['total_completed'] 
-        for k in PART1_MEMBERS if k in submissions
-    )
+    part1_completed = sum(data['total_completed'] for data in part1_submissions.values())
     part1_avg = round((part1_completed / (len(PART1_MEMBERS) * 10)) * 100) if PART1_MEMBERS else 0
-    
-    part2_completed = sum(
-        submissions[k]['total_completed'] 
-        for k in PART2_MEMBERS if k in submissions
-    )
+
+    part2_completed = sum(data['total_completed'] for data in part2_submissions.values())
     part2_avg = round((part2_completed / (len(PART2_MEMBERS) * 10)) * 100) if PART2_MEMBERS else 0
-    
+
     # 챕터별 완료 현황 (차트용)
     chapter_stats = {}
     for i in range(1, 11):
         ch_key = f'ch{i:02d}'
-        completed_count = sum(
+        chapter_stats[f'Ch{i:02d}'] = sum(
             1 for data in submissions.values()
             if data['submissions'][ch_key]['completed']
         )
-        chapter_stats[f'Ch{i:02d}'] = completed_count
-    
-    # PART별 퀴즈 TOP 3
-    part1_quiz_top = []
-    part2_quiz_top = []
-    
-    if supabase:
-        try:
-            response = supabase.table('quiz_completions').select('*').execute()
-            user_counts = {}
-            for record in response.data:
-                user_name = record['user_name']
-                user_counts[user_name] = user_counts.get(user_name, 0) + 1
-            
-            # PART1 멤버의 이름 목록 생성
-            part1_names = [REPO_NAME_MAPPING[repo] for repo in PART1_MEMBERS if repo in REPO_NAME_MAPPING]
-            part2_names = [REPO_NAME_MAPPING[repo] for repo in PART2_MEMBERS if repo in REPO_NAME_MAPPING]
-            
-            # PART별로 분리
-            part1_counts = {name: count for name, count in user_counts.items() if name in part1_names}
-            part2_counts = {name: count for name, count in user_counts.items() if name in part2_names}
-            
-            part1_quiz_top = sorted(part1_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-            part2_quiz_top = sorted(part2_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        except:
-            pass
-    
-    # 최근 논문 3개
-    recent_papers = []
+
+    return {
+        'members_count': members_count,
+        'avg_progress': avg_progress,
+        'part1_top_users': part1_top_users,
+        'part2_top_users': part2_top_users,
+        'part1_avg': part1_avg,
+        'part2_avg': part2_avg,
+        'chapter_stats': chapter_stats,
+        'part1_submissions': part1_submissions,
+        'part2_submissions': part2_submissions,
+        'part1_submit_rate': part1_submit_rate,
+        'part1_not_submit_rate': 100 - part1_submit_rate,
+        'part2_submit_rate': part2_submit_rate,
+        'part2_not_submit_rate': 100 - part2_submit_rate,
+        'part1_current_ch': part1_current_str,
+        'part2_current_ch': part2_current_str,
+    }
+
+def compute_quiz_top():
+    """PART별 퀴즈 완료 TOP 3 (퀴즈 인덱스 기준, flush 대기 중인 완료 포함)"""
+    state = leaderboard_state
+    with state['lock']:
+        ensure_quiz_index()
+        if state['quiz_loaded_at'] is None:
+            raise RuntimeError('퀴즈 완료 기록을 불러오지 못했습니다')
+        user_counts = dict(state['quiz_counts'])
+
+    part1_names = {REPO_NAME_MAPPING[repo] for repo in PART1_MEMBERS if repo in REPO_NAME_MAPPING}
+    part2_names = {REPO_NAME_MAPPING[repo] for repo in PART2_MEMBERS if repo in REPO_NAME_MAPPING}
+
+    part1_counts = {name: count for name, count in user_counts.items() if name in part1_names}
+    part2_counts = {name: count for name, count in user_counts.items() if name in part2_names}
+
+    return {
+        'part1_quiz_top': sorted(part1_counts.items(), key=lambda x: x[1], reverse=True)[:3],
+        'part2_quiz_top': sorted(part2_counts.items(), key=lambda x: x[1], reverse=True)[:3],
+    }
+
+def compute_recent_papers():
+    """최근 논문 3개"""
+    response = supabase.table('papers').select('*').order('created_at', desc=True).limit(3).execute()
+    return {'recent_papers': response.data}
+
+def get_dashboard_aggregates():
+    """메인 대시보드 집계 (스냅샷 / 논문 버전이 바뀔 때만 다시 계산, 퀴즈 TOP 3 는 퀴즈 인덱스 기준)"""
+    submissions = fetch_all_submissions()
+    # 이미 지난 스냅샷이면 버전이 None 이라 캐시에 넣지 않고 이번 응답에만 사용
+    aggregates = dict(get_cached_aggregate(
+        'dashboard_submissions', get_snapshot_version(submissions),
+        lambda: compute_submission_aggregates(submissions)
+    ))
+
+    aggregates['part1_quiz_top'] = []
+    aggregates['part2_quiz_top'] = []
+    aggregates['recent_papers'] = []
+
     if supabase:
         try:
-            response = supabase.table('papers').select('*').order('created_at', desc=True).limit(3).execute()
-            recent_papers = response.data
+            # 퀴즈 인덱스에서 바로 계산 (멤버 수만큼의 정렬이라 캐시 없이도 가벼움)
+            aggregates.update(compute_quiz_top())
         except:
             pass
-    
 
-    
-    return render_template('index.html',
-                         members_count=members_count,
-                         avg_progress=avg_progress,
-                         part1_top_users=part1_top_users,
-                         part2_top_users=part2_top_users,
-                         part1_avg=part1_avg,
-                         part2_avg=part2_avg,
-                         chapter_stats=chapter_stats,
-                         part1_submissions=part1_submissions,
-                         part2_submissions=part2_submissions,
-                         part1_quiz_top=part1_quiz_top,
-                         part2_quiz_top=part2_quiz_top,
-                         part1_submit_rate=part1_submit_rate,
-                         part1_not_submit_rate=part1_not_submit_rate,
-                         part2_submit_rate=part2_submit_rate,
-                         part2_not_submit_rate=part2_not_submit_rate,
-                         part1_current_ch=part1_current_str,
-                         part2_current_ch=part2_current_str,
-                         recent_papers=recent_papers,
-                     )
+        try:
+            aggregates.update(get_cached_aggregate(
+                'dashboard_recent_papers', data_versions['papers'], compute_recent_papers, AGGREGATE_TTL
+            ))
+        except:
+            pass
+
+    return aggregates
+
+# =========================
+# 라우트 정의
+# =========================
+
+@app.before_request
+def ensure_client_health_checks():
+    """첫 요청 때 외부 서비스 헬스 체크 (와 퀴즈 flush 워커) 를 백그라운드로 시작"""
+    start_client_health_checks()
+    if QUIZ_WRITE_BEHIND['enabled'] and supabase:
+        # 이전 프로세스가 남긴 대기열도 비우도록 첫 요청부터 워커 실행
+        start_quiz_flusher()
+
+@app.context_processor
+def inject_submissions_age():
+    """모든 템플릿에 제출 현황 스냅샷 경과 시간 제공"""
+    return {'submissions_age': get_submissions_age()}
+
+@app.route('/')
+def index():
+    """간소화된 메인 대시보드"""
+    return render_template('index.html', **get_dashboard_aggregates())
 
 
 
@@ -1128,19 +1983,132 @@ def paper_detail(paper_id):
     """논문 상세 페이지"""
     return render_template('paper_detail.html', paper_id=paper_id)
 
+PAPERS_PAGE_SIZE = 20
+PAPERS_MAX_PAGE_SIZE = 100
+# 목록에서 보여줄 내용 미리보기 길이 (전체 내용은 /api/papers/<id> 에서만)
+PAPER_PREVIEW_LENGTH = 150
+PAPER_LIST_COLUMNS = 'id, title, author, link, created_at, content'
+PAPER_BULK_MAX_IDS = 100
+PAPER_LATEST_COMMENTS = 3
+PAPER_MAX_LATEST_COMMENTS = 50
+PAPER_CURSOR_PATTERN = re.compile(r'^([0-9T:.+\- ]+)\|(\d+)$')
+
+def encode_paper_cursor(paper):
+    """다음 페이지 커서 'created_at|id'"""
+    return f"{paper['created_at']}|{paper['id']}"
+
+def decode_paper_cursor(cursor):
+    """커서를 (created_at, id) 로 변환, 형식이 틀리면 ValueError"""
+    match = PAPER_CURSOR_PATTERN.match(cursor)
+    if not match:
+        raise ValueError(f"잘못된 커서: {cursor}")
+    return match.group(1), int(match.group(2))
+
+def summarize_paper(paper):
+    """목록용 요약 (내용은 미리보기만)"""
+    content = paper.get('content') or ''
+    return {
+        'id': paper['id'],
+        'title': paper['title'],
+        'author': paper['author'],
+        'link': paper['link'],
+        'created_at': paper['created_at'],
+        'preview': content[:PAPER_PREVIEW_LENGTH],
+        'truncated': len(content) > PAPER_PREVIEW_LENGTH,
+    }
+
+def fetch_paper_page(cursor=None, limit=PAPERS_PAGE_SIZE):
+    """(created_at, id) 내림차순 keyset 페이지네이션 - 몇 번째 페이지든 limit + 1 행만 조회"""
+    query = supabase.table('papers').select(PAPER_LIST_COLUMNS)
+    if cursor:
+        created_at, paper_id = decode_paper_cursor(cursor)
+        query = query.or_(f"created_at.lt.{created_at},and(created_at.eq.{created_at},id.lt.{paper_id})")
+    rows = query.order('created_at', desc=True).order('id', desc=True).limit(limit + 1).execute().data
+
+    next_cursor = encode_paper_cursor(rows[limit - 1]) if len(rows) > limit else None
+    papers = [summarize_paper(paper) for paper in rows[:limit]]
+    comment_summaries = fetch_comment_summaries([paper['id'] for paper in papers])
+    for paper in papers:
+        paper['comment_count'] = comment_summaries[paper['id']]['comment_count']
+    return papers, next_cursor
+
+def fetch_comment_summaries(paper_ids, latest=0):
+    """{논문 id: {'comment_count', 'latest_comments'}} - 논문 묶음의 댓글을 한 번에 (max-rows 단위로 페이지) 조회해 그룹화
+
+    latest: 논문별로 함께 돌려줄 최근 댓글 수 (0 이면 개수만, None 이면 전체), 댓글은 작성 순
+    """
+    summaries = {paper_id: {'comment_count': 0, 'latest_comments': []} for paper_id in paper_ids}
+    if not paper_ids:
+        return summaries
+
+    columns = 'id, paper_id' if latest == 0 else 'id, paper_id, author, content, created_at'
+    rows = fetch_all_rows(lambda: supabase.table('comments').select(columns).in_('paper_id', paper_ids), ['id'])
+    if latest != 0:
+        rows.sort(key=lambda row: (row['created_at'], row['id']), reverse=True)
+
+    for row in rows:
+        summary = summaries[row['paper_id']]
+        summary['comment_count'] += 1
+        if latest is None or len(summary['latest_comments']) < latest:
+            summary['latest_comments'].append(row)
+    for summary in summaries.values():
+        summary['latest_comments'].reverse()
+    return summaries
+
 @app.route('/api/papers', methods=['GET'])
 def get_papers():
-    """논문 목록 조회"""
+    """논문 목록 조회 (?cursor=&limit=, 요약 필드만)"""
     try:
         if supabase:
-            response = supabase.table('papers').select('*').order('created_at', desc=True).execute()
-            return jsonify(response.data)
+            limit = min(max(request.args.get('limit', PAPERS_PAGE_SIZE, type=int), 1), PAPERS_MAX_PAGE_SIZE)
+            try:
+                papers, next_cursor = fetch_paper_page(request.args.get('cursor'), limit)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            return jsonify({'papers': papers, 'next_cursor': next_cursor})
         else:
-            return jsonify([]), 500
+            return jsonify({'papers': [], 'next_cursor': None}), 500
     except Exception as e:
         print(f"[ERROR] 논문 목록 조회 실패: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/papers/bulk', methods=['GET'])
+def get_papers_bulk():
+    """여러 논문을 댓글 수 / 최근 댓글과 함께 조회 (?ids=1,2,3&comments=3|all, 쿼리 2회)"""
+    try:
+        if not supabase:
+            return jsonify({'error': 'Supabase 연결 없음'}), 500
+
+        try:
+            paper_ids = list(dict.fromkeys(int(paper_id) for paper_id in request.args.get('ids', '').split(',') if paper_id.strip()))
+        except ValueError:
+            return jsonify({'error': 'ids 는 쉼표로 구분한 논문 id 여야 합니다'}), 400
+        if len(paper_ids) > PAPER_BULK_MAX_IDS:
+            return jsonify({'error': f'ids 는 최대 {PAPER_BULK_MAX_IDS}개까지 가능합니다'}), 400
+
+        comments_arg = request.args.get('comments', str(PAPER_LATEST_COMMENTS))
+        if comments_arg == 'all':
+            latest = None
+        elif comments_arg.isdigit():
+            latest = min(int(comments_arg), PAPER_MAX_LATEST_COMMENTS)
+        else:
+            return jsonify({'error': "comments 는 숫자 또는 'all' 이어야 합니다"}), 400
+
+        if not paper_ids:
+            return jsonify({'papers': []})
+
+        rows = supabase.table('papers').select('*').in_('id', paper_ids).execute().data
+        papers_by_id = {paper['id']: paper for paper in rows}
+        comment_summaries = fetch_comment_summaries(list(papers_by_id), latest)
+
+        return jsonify({'papers': [
+            dict(papers_by_id[paper_id], **comment_summaries[paper_id])
+            for paper_id in paper_ids if paper_id in papers_by_id
+        ]})
+    except Exception as e:
+        print(f"[ERROR] 논문 일괄 조회 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/papers/<int:paper_id>', methods=['GET'])
 def get_paper(paper_id):
     """논문 상세 조회"""
@@ -1176,6 +2144,10 @@ def create_paper():
                 'content': content,
                 'link': link
             }).execute()
+            data_versions['papers'] += 1
+            record_paper(author)
+            for paper in response.data:
+                index_paper(paper)
             return jsonify({'success': True, 'data': response.data})
         else:
             return jsonify({'error': 'Supabase 연결 없음'}), 500
@@ -1214,6 +2186,7 @@ def create_comment(paper_id):
                 'author': author,
                 'content': content
             }).execute()
+            index_comment(paper_id, author, content)
             return jsonify({'success': True, 'data': response.data})
         else:
             return jsonify({'error': 'Supabase 연결 없음'}), 500
@@ -1221,6 +2194,178 @@ def create_comment(paper_id):
     except Exception as e:
         print(f"[ERROR] 댓글 작성 실패: {str(e)}")
         return jsonify({'error': str(e)}), 500
+
+# =========================
+# 논문 / 댓글 검색 인덱스
+# =========================
+
+# 필드별 가중치 (제목 > 작성자 > 본문 / 댓글)
+SEARCH_FIELD_WEIGHTS = {
+    'title': 3,
+    'author': 2,
+    'content': 1,
+    'comment': 1,
+}
+SEARCH_TOKEN_RUN = re.compile(r'\w+')
+# 다른 워커가 등록한 논문 / 댓글을 반영하도록 주기적으로 다시 적재
+SEARCH_INDEX_TTL = int(os.getenv('SEARCH_INDEX_TTL', '600'))
+SEARCH_PAGE_SIZE = 20
+
+def tokenize_search_text(text):
+    """소문자화 후 단어별 글자 2-gram (한 글자 단어는 그대로) - 형태소 분석 없이 한국어 부분 일치"""
+    tokens = []
+    for run in SEARCH_TOKEN_RUN.findall((text or '').lower()):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+class SearchIndex:
+    """논문 단위 역색인 {토큰: {논문 id: 가중 빈도}}
+
+    검색은 가장 드문 토큰의 posting 부터 교집합을 구한 뒤 TF-IDF 합으로 정렬
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._tokens_by_char = {}
+        self._docs = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add_paper(self, paper):
+        self._docs[paper['id']] = {
+            'id': paper['id'],
+            'title': paper.get('title'),
+            'author': paper.get('author'),
+            'created_at': paper.get('created_at'),
+        }
+        for field in ('title', 'author', 'content'):
+            self.add_text(paper['id'], paper.get(field), SEARCH_FIELD_WEIGHTS[field])
+
+    def add_text(self, paper_id, text, weight):
+        for token in tokenize_search_text(text):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for char in token:
+                    self._tokens_by_char.setdefault(char, set()).add(token)
+            postings[paper_id] = postings.get(paper_id, 0) + weight
+
+    def _query_postings(self, token):
+        """토큰의 posting, 한 글자 검색어는 그 글자를 포함한 모든 토큰의 합집합"""
+        if len(token) > 1:
+            return self._postings.get(token, {})
+        merged = {}
+        for candidate in self._tokens_by_char.get(token, ()):
+            for paper_id, weight in self._postings[candidate].items():
+                merged[paper_id] = merged.get(paper_id, 0) + weight
+        return merged
+
+    def search(self, query, offset=0, limit=SEARCH_PAGE_SIZE):
+        """(전체 적중 수, [(논문 요약, 점수), ...]) 점수 내림차순 (동점은 최신 id 우선)
+
+        정렬은 offset + limit 개만 (heap)
+        """
+        tokens = set(tokenize_search_text(query))
+        if not tokens:
+            return 0, []
+
+        postings_list = sorted((self._query_postings(token) for token in tokens), key=len)
+        candidates = set(postings_list[0]).intersection(self._docs)
+        for postings in postings_list[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(postings)
+        if not candidates:
+            return 0, []
+
+        # 토큰 단위로 점수 누적 (문서마다 generator 를 돌리는 것보다 빠름)
+        total_docs = len(self._docs)
+        candidates = list(candidates)
+        scores = [0.0] * len(candidates)
+        for postings in postings_list:
+            idf = math.log(1 + total_docs / len(postings))
+            scores = [score + postings[paper_id] * idf for score, paper_id in zip(scores, candidates)]
+        top = heapq.nlargest(offset + limit, zip(scores, candidates))
+        return len(candidates), [(self._docs[paper_id], score) for score, paper_id in top[offset:]]
+
+
+search_state = {
+    'index': None,
+    'loaded_at': None,
+    'lock': threading.RLock(),
+}
+
+def load_search_index():
+    """Supabase 의 논문 / 댓글 전체로 검색 인덱스 재구성 (테이블별 페이지 조회)"""
+    papers = fetch_all_rows(lambda: supabase.table('papers').select('id, title, author, content, created_at'), ['id'])
+    comments = fetch_all_rows(lambda: supabase.table('comments').select('id, paper_id, author, content'), ['id'])
+
+    index = SearchIndex()
+    for paper in papers:
+        index.add_paper(paper)
+    for comment in comments:
+        index.add_text(comment['paper_id'], comment.get('author'), SEARCH_FIELD_WEIGHTS['comment'])
+        index.add_text(comment['paper_id'], comment.get('content'), SEARCH_FIELD_WEIGHTS['comment'])
+
+    search_state['index'] = index
+    search_state['loaded_at'] = time.time()
+
+def ensure_search_index():
+    """인덱스가 없거나 TTL 이 지났으면 재구성"""
+    with search_state['lock']:
+        if search_state['loaded_at'] is None or time.time() - search_state['loaded_at'] >= SEARCH_INDEX_TTL:
+            try:
+                load_search_index()
+            except Exception as e:
+                if search_state['index'] is None:
+                    raise
+                print(f"[ERROR] 검색 인덱스 재구성 실패 - 이전 인덱스 사용: {str(e)}")
+        return search_state['index']
+
+def index_paper(paper):
+    """새 논문을 검색 인덱스에 반영 (인덱스가 아직 없으면 첫 검색 때 전체 적재)"""
+    with search_state['lock']:
+        if search_state['index'] is not None:
+            search_state['index'].add_paper(paper)
+
+def index_comment(paper_id, author, content):
+    """새 댓글을 해당 논문 문서에 반영"""
+    with search_state['lock']:
+        if search_state['index'] is not None:
+            search_state['index'].add_text(paper_id, author, SEARCH_FIELD_WEIGHTS['comment'])
+            search_state['index'].add_text(paper_id, content, SEARCH_FIELD_WEIGHTS['comment'])
+
+@app.route('/api/papers/search')
+def search_papers():
+    """논문 검색 (?q=&offset=&limit=, 제목 / 작성자 / 내용 / 댓글 대상)"""
+    try:
+        if not supabase:
+            return jsonify({'error': 'Supabase 연결 없음'}), 500
+
+        query = request.args.get('q', '').strip()
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        limit = min(max(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), 1), PAPERS_MAX_PAGE_SIZE)
+
+        index = ensure_search_index()
+        with search_state['lock']:
+            total, hits = index.search(query, offset, limit)
+
+        return jsonify({
+            'query': query,
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'results': [dict(paper, score=round(score, 4)) for paper, score in hits],
+        })
+    except Exception as e:
+        print(f"[ERROR] 논문 검색 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/debug')
 def debug():
     submissions = fetch_all_submissions()
@@ -1247,6 +2392,37 @@ def debug():
     
     return render_template('debug.html', debug_info=debug_info)
 
+# 디버그 페이지의 파일명 감지 테스트용 샘플
+FILENAME_DETECTION_SAMPLES = [
+    'ch01.ipynb', 'Ch02_실습.ipynb', 'ch_03.ipynb', 'ch-4.py', 'ch 5 과제.ipynb',
+    'chapter06.ipynb', 'Chapter7.ipynb', 'chap08.ipynb', 'chap_9.ipynb',
+    'week10.ipynb', 'week_1.py', '02-데이터다루기.ipynb', '03.회귀.ipynb',
+    '혼공머신_ch04_로지스틱.ipynb', 'ch3/practice.ipynb', 'main.py', 'README.ipynb',
+]
+
+@app.route('/api/test-filename-detection', methods=['GET', 'POST'])
+def test_filename_detection():
+    """파일명 챕터 감지 API
+
+    GET: 샘플 파일명 감지 결과 (디버그 페이지)
+    POST {"paths": [...]}: 경로 목록 일괄 분류 (배정 / 충돌 / 미감지)
+    """
+    if request.method == 'GET':
+        return jsonify([
+            {'filename': filename, 'detected': detect_chapter_from_filename(filename)}
+            for filename in FILENAME_DETECTION_SAMPLES
+        ])
+
+    data = request.get_json(silent=True) or {}
+    paths = data.get('paths')
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        return jsonify({'error': 'paths 는 문자열 목록이어야 합니다'}), 400
+
+    started = time.perf_counter()
+    result = classify_chapter_paths(paths)
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+    return jsonify(result)
+
 # API 라우트
 @app.route('/api/users')
 def get_users():
@@ -1256,40 +2432,7 @@ def get_users():
 @app.route('/api/quiz-stats')
 def quiz_stats():
     try:
-        if supabase:
-            response = supabase.table('quiz_completions').select('*').execute()
-            stats = {}
-            
-            for chapter, quiz_list in QUIZZES.items():
-                for quiz in quiz_list:
-                    quiz_id = quiz['id']
-                    completed_users = [
-                        record['user_name'] 
-                        for record in response.data 
-                        if record['quiz_id'] == quiz_id
-                    ]
-                    
-                    stats[quiz_id] = {
-                        'completed': len(completed_users),
-                        'users': completed_users
-                    }
-            
-            return jsonify(stats)
-        else:
-            quiz_results = load_quiz_results()
-            stats = {}
-            
-            for chapter, quiz_list in QUIZZES.items():
-                for quiz in quiz_list:
-                    quiz_id = quiz['id']
-                    completed_users = [user for user in quiz_results.keys() 
-                                      if quiz_id in quiz_results[user].get('completed_quizzes', [])]
-                    stats[quiz_id] = {
-                        'completed': len(completed_users),
-                        'users': completed_users
-                    }
-            
-            return jsonify(stats)
+        return jsonify(get_quiz_stats())
     
     except Exception as e:
         print(f"[ERROR] 퀴즈 통계 조회 실패: {str(e)}")
@@ -1306,21 +2449,21 @@ def quiz_complete():
             return jsonify({'error': '필수 정보 누락'}), 400
         
         if supabase:
-            response = supabase.table('quiz_completions').upsert({
-                'user_name': user_name,
-                'quiz_id': quiz_id,
-                'completed_at': datetime.now().isoformat()
-            }).execute()
+            if not (QUIZ_WRITE_BEHIND['enabled'] and enqueue_quiz_completion(user_name, quiz_id)):
+                response = supabase.table('quiz_completions').upsert({
+                    'user_name': user_name,
+                    'quiz_id': quiz_id,
+                    'completed_at': datetime.now().isoformat()
+                }).execute()
+            # 같은 호스트의 다른 워커도 바로 보도록 로컬 로그에도 남김 (원본은 Supabase)
+            try:
+                insert_local_quiz_completion(user_name, quiz_id)
+            except Exception as e:
+                print(f"[WARNING] 로컬 퀴즈 로그 기록 실패: {str(e)}")
         else:
-            quiz_results = load_quiz_results()
-            
-            if user_name not in quiz_results:
-                quiz_results[user_name] = {'completed_quizzes': []}
-            
-            if quiz_id not in quiz_results[user_name]['completed_quizzes']:
-                quiz_results[user_name]['completed_quizzes'].append(quiz_id)
-            
-            save_quiz_results(quiz_results)
+            insert_local_quiz_completion(user_name, quiz_id)
+
+        record_quiz_completion(user_name, quiz_id)
         
         return jsonify({'success': True})
     
@@ -1331,24 +2474,9 @@ def quiz_complete():
 @app.route('/api/quiz-leaderboard')
 def quiz_leaderboard():
     try:
-        if supabase:
-            response = supabase.table('quiz_completions').select('*').execute()
-            user_counts = {}
-            for record in response.data:
-                user_name = record['user_name']
-                user_counts[user_name] = user_counts.get(user_name, 0) + 1
-        else:
-            quiz_results = load_quiz_results()
-            user_counts = {
-                user: len(data.get('completed_quizzes', []))
-                for user, data in quiz_results.items()
-            }
-        
-        leaderboard = sorted(
-            user_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        limit = request.args.get('limit', type=int)
+
+        leaderboard = get_quiz_leaderboard(limit)
         
         return jsonify([
             {'rank': idx + 1, 'name': name, 'completed': count}
@@ -1361,116 +2489,637 @@ def quiz_leaderboard():
 
 @app.route('/api/refresh-cache', methods=['POST'])
 def refresh_cache():
-    cache['submissions'] = None
-    cache['last_updated'] = 0
-    fetch_all_submissions()
+    """제출 현황 즉시 갱신 (진행 중인 재빌드가 있으면 합류)"""
+    if g:
+        refresh_submissions(force=True)
     return jsonify({'success': True, 'message': 'Cache refreshed'})
 
-@app.route('/ranking')
-def ranking():
-    """종합 랭킹 페이지"""
-    submissions = fetch_all_submissions()
-    
-    # 전체 랭킹 계산
-    rankings = []
-    for repo_name, data in submissions.items():
-        name = data['name']
-        chapter_score = data['total_completed'] * 10
-        
-        # 퀴즈 점수 및 개수
-        quiz_count = 0
-        quiz_score = 0
-        if supabase:
-            try:
-                response = supabase.table('quiz_completions').select('*').eq('user_name', name).execute()
-                quiz_count = len(response.data)
-                quiz_score = quiz_count * 5
-            except:
-                pass
-        
-        # 논문 점수 및 개수
-        paper_count = 0
-        paper_score = 0
-        if supabase:
-            try:
-                response = supabase.table('papers').select('*').eq('author', name).execute()
-                paper_count = len(response.data)
-                paper_score = paper_count * 2
-            except:
+@app.route('/webhooks/github', methods=['POST'])
+def github_webhook():
+    """GitHub push 웹훅 - 해당 멤버의 제출 현황만 즉시 갱신"""
+    body = request.get_data()
+    if not verify_github_signature(body, request.headers.get('X-Hub-Signature-256')):
+        return jsonify({'error': '서명 검증 실패'}), 403
+
+    event = request.headers.get('X-GitHub-Event')
+    if event == 'ping':
+        return jsonify({'success': True, 'message': 'pong'})
+    if event != 'push':
+        return jsonify({'success': True, 'ignored': event}), 202
+
+    try:
+        payload = json.loads(body)
+        result, repo_name = apply_push_event(payload)
+        if result == 'deferred':
+            return jsonify({'success': True, 'repo_name': repo_name, 'deferred': True}), 202
+        if result != 'applied':
+            return jsonify({'success': True, 'ignored': result}), 202
+        return jsonify({'success': True, 'repo_name': repo_name, 'version': cache['version']})
+    except Exception as e:
+        print(f"[ERROR] 웹훅 처리 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/internal/github-status')
+def github_status():
+    """GitHub 요청 한도 / 사용량 (내부 모니터링용)"""
+    with rate_budget['lock']:
+        budget = {key: value for key, value in rate_budget.items() if key != 'lock'}
+    budget['paced_seconds'] = round(budget['paced_seconds'], 3)
+    return jsonify({
+        'rate_budget': budget,
+        'last_scan': {
+            'duration': scan_stats['total_duration'],
+            'scanned_at': scan_stats['scanned_at'],
+            'unchanged': scan_stats['unchanged'],
+            'not_modified': scan_stats['not_modified'],
+            'errors': scan_stats['errors'],
+        },
+        'snapshot_age_seconds': get_submissions_age(),
+    })
+
+@app.route('/api/internal/health')
+def health():
+    """외부 서비스 연결 상태"""
+    return jsonify({
+        'github': client_status['github'],
+        'supabase': client_status['supabase'],
+    })
+
+@app.route('/api/cache-status')
+def cache_status():
+    """제출 현황 스냅샷 상태"""
+    return jsonify({
+        'version': cache['version'],
+        'last_updated': cache['last_updated'],
+        'age_seconds': get_submissions_age(),
+        'scanned_at': cache['scanned_at'],
+        'refresh_interval': cache['cache_duration'],
+        'refreshing': refresher_state['in_flight'] is not None,
+        'coalesced_refreshes': refresher_state['coalesced'],
+        'scan_failures': cache['scan_failures'],
+        'pending_pushes': len(pending_pushes['queue']),
+        'deferred_pushes': pending_pushes['deferred'],
+        'last_error': cache['last_error'],
+    })
+
+@app.route('/api/internal/quiz-queue')
+def quiz_queue_status():
+    """퀴즈 완료 write-behind 대기열 상태"""
+    pending = len(read_pending_quiz_rows()) if QUIZ_WRITE_BEHIND['enabled'] else 0
+    return jsonify({
+        'enabled': QUIZ_WRITE_BEHIND['enabled'],
+        'pending': pending,
+        'max_pending': QUIZ_WRITE_BEHIND['max_pending'],
+        'flushed': quiz_flush_state['flushed'],
+        'failures': quiz_flush_state['failures'],
+        'last_error': quiz_flush_state['last_error'],
+        'last_flush': quiz_flush_state['last_flush'],
+    })
+
+@app.route('/api/scan-stats')
+def get_scan_stats():
+    """마지막 GitHub 스캔의 레포별 소요 시간"""
+    return jsonify(scan_stats)
+
+# PostgREST 는 한 응답을 max-rows (Supabase 기본 1000행) 로 자르므로 전체 조회는 이 크기로 나눠 받음
+# 서버의 max-rows 보다 크면 잘린 페이지를 마지막 페이지로 오인하므로 같거나 작게 설정
+SUPABASE_PAGE_SIZE = int(os.getenv('SUPABASE_PAGE_SIZE', '1000'))
+
+def fetch_all_rows(build_query, order_columns):
+    """build_query() 결과를 order_columns 순서로 .range() 페이지 조회해 전체 행 반환
+
+    페이지 경계가 흔들리지 않도록 order_columns 는 행을 유일하게 정렬하는 컬럼이어야 함
+    """
+    rows = []
+    start = 0
+    while True:
+        query = build_query()
+        for column in order_columns:
+            query = query.order(column)
+        page = query.range(start, start + SUPABASE_PAGE_SIZE - 1).execute().data
+        rows.extend(page)
+        if len(page) < SUPABASE_PAGE_SIZE:
+            return rows
+        start += SUPABASE_PAGE_SIZE
+
+def count_by_field(table, field):
+    """테이블 전체에서 field 값별 행 수 (해당 컬럼만 id 순으로 페이지 조회)"""
+    counts = {}
+    for record in fetch_all_rows(lambda: supabase.table(table).select(f'id, {field}'), ['id']):
+        value = record[field]
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+local_quiz_store = {
+    'initialized': False,
+    'lock': threading.Lock(),
+    'connections': threading.local(),
+}
+
+def init_local_quiz_db(conn):
+    """테이블 / 인덱스 생성, 비어 있으면 기존 QUIZ_DATA_FILE(JSON) 내용을 옮겨 옴"""
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS quiz_completions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_name TEXT NOT NULL,
+            quiz_id TEXT NOT NULL,
+            completed_at TEXT NOT NULL,
+            UNIQUE (user_name, quiz_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_quiz_completions_quiz_id ON quiz_completions (quiz_id);
+        CREATE TABLE IF NOT EXISTS pending_quiz_completions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_name TEXT NOT NULL,
+            quiz_id TEXT NOT NULL,
+            completed_at TEXT NOT NULL,
+            UNIQUE (user_name, quiz_id)
+        );
+        CREATE TABLE IF NOT EXISTS shared_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+    """)
+
+    has_rows = conn.execute('SELECT 1 FROM quiz_completions LIMIT 1').fetchone()
+    if not has_rows and os.path.exists(QUIZ_DATA_FILE):
+        try:
+            with open(QUIZ_DATA_FILE, 'r', encoding='utf-8') as f:
+                quiz_results = json.load(f)
+            now = datetime.now().isoformat()
+            with conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO quiz_completions (user_name, quiz_id, completed_at) VALUES (?, ?, ?)',
+                    [
+                        (user_name, quiz_id, now)
+                        for user_name, data in quiz_results.items()
+                        for quiz_id in data.get('completed_quizzes', [])
+                    ]
+                )
+        except Exception as e:
+            print(f"[ERROR] {QUIZ_DATA_FILE} 이전 실패: {str(e)}")
+
+def get_local_quiz_db():
+    """스레드별 SQLite 연결 (처음 연결할 때 스키마 초기화)"""
+    connections = local_quiz_store['connections']
+    conn = getattr(connections, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(QUIZ_DB_FILE, timeout=10)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with local_quiz_store['lock']:
+            if not local_quiz_store['initialized']:
+                init_local_quiz_db(conn)
+                local_quiz_store['initialized'] = True
+        connections.conn = conn
+    return conn
+
+def insert_local_quiz_completion(user_name, quiz_id):
+    """퀴즈 완료 1건 추가 (이미 있으면 무시) - 파일 전체를 다시 쓰지 않는 O(1) 추가"""
+    conn = get_local_quiz_db()
+    with conn:
+        conn.execute(
+            'INSERT OR IGNORE INTO quiz_completions (user_name, quiz_id, completed_at) VALUES (?, ?, ?)',
+            (user_name, quiz_id, datetime.now().isoformat())
+        )
+
+def get_local_quiz_last_id():
+    """로컬 완료 기록의 마지막 id (없으면 0)"""
+    return get_local_quiz_db().execute('SELECT COALESCE(MAX(id), 0) FROM quiz_completions').fetchone()[0]
+
+def read_local_quiz_rows(after_id=0):
+    """id 순서대로 after_id 이후의 완료 기록 [(id, user_name, quiz_id), ...]"""
+    return get_local_quiz_db().execute(
+        'SELECT id, user_name, quiz_id FROM quiz_completions WHERE id > ? ORDER BY id',
+        (after_id,)
+    ).fetchall()
+
+def get_shared_version(name):
+    """같은 호스트의 워커들이 공유하는 데이터 버전 (로컬 SQLite), 읽지 못하면 None"""
+    try:
+        row = get_local_quiz_db().execute('SELECT version FROM shared_versions WHERE name = ?', (name,)).fetchone()
+    except Exception as e:
+        print(f"[WARNING] 공유 버전 조회 실패 ({name}): {str(e)}")
+        return None
+    return row[0] if row else 0
+
+def bump_shared_version(name):
+    """공유 데이터 버전 증가 - 모든 워커의 해당 캐시가 다음 조회 때 다시 계산됨"""
+    try:
+        conn = get_local_quiz_db()
+        with conn:
+            conn.execute(
+                'INSERT INTO shared_versions (name, version) VALUES (?, 1) '
+                'ON CONFLICT(name) DO UPDATE SET version = version + 1',
+                (name,)
+            )
+    except Exception as e:
+        print(f"[WARNING] 공유 버전 갱신 실패 ({name}): {str(e)}")
+
+def enqueue_quiz_completion(user_name, quiz_id):
+    """Supabase 로 보낼 퀴즈 완료를 로컬 대기열에 기록
+
+    대기열이 QUIZ_WRITE_BEHIND['max_pending'] 이상이면 False (호출 측에서 바로 upsert)
+    """
+    conn = get_local_quiz_db()
+    with conn:
+        pending = conn.execute('SELECT COUNT(*) FROM pending_quiz_completions').fetchone()[0]
+        if pending >= QUIZ_WRITE_BEHIND['max_pending']:
+            return False
+        conn.execute(
+            'INSERT OR IGNORE INTO pending_quiz_completions (user_name, quiz_id, completed_at) VALUES (?, ?, ?)',
+            (user_name, quiz_id, datetime.now().isoformat())
+        )
+
+    start_quiz_flusher()
+    if pending + 1 >= QUIZ_WRITE_BEHIND['batch_size']:
+        quiz_flush_state['wakeup'].set()
+    return True
+
+def read_pending_quiz_rows(limit=None):
+    """아직 Supabase 에 반영되지 않은 완료 기록 [(id, user_name, quiz_id, completed_at), ...]"""
+    query = 'SELECT id, user_name, quiz_id, completed_at FROM pending_quiz_completions ORDER BY id'
+    if limit is not None:
+        return get_local_quiz_db().execute(query + ' LIMIT ?', (limit,)).fetchall()
+    return get_local_quiz_db().execute(query).fetchall()
+
+def flush_quiz_completions():
+    """대기열에서 batch_size 건을 Supabase 에 한 번에 upsert, 성공하면 대기열에서 삭제
+
+    여러 워커가 같은 행을 보내도 upsert 라서 결과는 같음
+    """
+    rows = read_pending_quiz_rows(QUIZ_WRITE_BEHIND['batch_size'])
+    if not rows:
+        return 0
+
+    supabase.table('quiz_completions').upsert([
+        {'user_name': user_name, 'quiz_id': quiz_id, 'completed_at': completed_at}
+        for _, user_name, quiz_id, completed_at in rows
+    ]).execute()
+
+    conn = get_local_quiz_db()
+    with conn:
+        conn.executemany('DELETE FROM pending_quiz_completions WHERE id = ?', [(row[0],) for row in rows])
+
+    quiz_flush_state['flushed'] += len(rows)
+    quiz_flush_state['last_flush'] = time.time()
+    return len(rows)
+
+def quiz_flush_loop():
+    """대기열을 주기적으로 비우는 백그라운드 워커 (실패하면 지수 백오프 후 재시도)"""
+    state = quiz_flush_state
+    while True:
+        state['wakeup'].wait(QUIZ_WRITE_BEHIND['interval'])
+        state['wakeup'].clear()
+        try:
+            while flush_quiz_completions() == QUIZ_WRITE_BEHIND['batch_size']:
                 pass
-        
-        total_score = chapter_score + quiz_score + paper_score
-        
-        
-        # 뱃지 계산
-        badges = []
-        
-        # 💎 완벽주의자: 전체 챕터 완료
-        if data['total_completed'] >= 10:
-            badges.append({'icon': '💎', 'name': '완벽주의자'})
-        
-        # 🎯 퀴즈 마스터: 퀴즈 10개 이상 완료
-        if quiz_count >= 10:
-            badges.append({'icon': '🎯', 'name': '퀴즈 마스터'})
-        
-        # 📚 북웜: 논문 공유 5회 이상
-        if paper_count >= 5:
-            badges.append({'icon': '📚', 'name': '북웜'})
-        
-        # 🥇 골드 러너: 6챕터 이상 완료
-        if data['total_completed'] >= 6:
-            badges.append({'icon': '🥇', 'name': '골드 러너'})
-        
-        # 🔥 불꽃 학습자: 3챕터 이상 완료
-        if data['total_completed'] >= 3:
-            badges.append({'icon': '🔥', 'name': '불꽃 학습자'})
-        
-        
-        # 레벨 계산
-        if total_score >= 150:
-            level = "🏆 그랜드 마스터"
-            level_color = "#FFD700"
-        elif total_score >= 100:
-            level = "💎 마스터"
-            level_color = "#C0C0C0"
-        elif total_score >= 70:
-            level = "⭐ 전문가"
-            level_color = "#CD7F32"
-        elif total_score >= 40:
-            level = "🔥 열정적인 학습자"
-            level_color = "#FF6B6B"
-        else:
-            level = "🌱 초보 학습자"
-            level_color = "#51CF66"
-        
-        rankings.append({
-            'name': name,
-            'repo_name': repo_name,
-            'total_score': total_score,
-            'chapter_score': chapter_score,
-            'quiz_score': quiz_score,
-            'paper_score': paper_score,
-            'quiz_count': quiz_count,
-            'paper_count': paper_count,
-            'badges': badges,
-            'level': level,
-            'level_color': level_color,
-            'chapters_completed': data['total_completed'],
-        })
-    
-    # 점수순 정렬
-    rankings.sort(key=lambda x: x['total_score'], reverse=True)
-    
-    # 순위 부여 (동점 처리)
-    current_rank = 0
-    prev_score = None
-    for idx, data in enumerate(rankings, start=1):
-        if data['total_score'] != prev_score:
-            current_rank = idx
-            prev_score = data['total_score']
-        data['rank'] = current_rank
-    
-    # TOP 3 순위별 그룹 생성
+            state['failures'] = 0
+            state['last_error'] = None
+        except Exception as e:
+            state['failures'] += 1
+            state['last_error'] = str(e)
+            backoff = min(60, QUIZ_WRITE_BEHIND['interval'] * 2 ** state['failures'])
+            print(f"[ERROR] 퀴즈 완료 flush 실패 ({state['failures']}회), {backoff:.1f}초 후 재시도: {str(e)}")
+            time.sleep(backoff)
+
+def start_quiz_flusher():
+    """퀴즈 flush 워커 시작 (프로세스당 한 번)"""
+    with quiz_flush_state['lock']:
+        if quiz_flush_state['thread'] is None:
+            thread = threading.Thread(target=quiz_flush_loop, name='quiz-flusher', daemon=True)
+            thread.start()
+            quiz_flush_state['thread'] = thread
+
+def build_ranking_entry(repo_name, data, quiz_count, paper_count):
+    """멤버 한 명의 종합 점수 / 뱃지 / 레벨 계산"""
+    name = data['name']
+    chapter_score = data['total_completed'] * 10
+
+    # 퀴즈 / 논문 점수
+    quiz_score = quiz_count * 5
+    paper_score = paper_count * 2
+
+    total_score = chapter_score + quiz_score + paper_score
+
+
+    # 뱃지 계산
+    badges = []
+
+    # 💎 완벽주의자: 전체 챕터 완료
+    if data['total_completed'] >= 10:
+        badges.append({'icon': '💎', 'name': '완벽주의자'})
+
+    # 🎯 퀴즈 마스터: 퀴즈 10개 이상 완료
+    if quiz_count >= 10:
+        badges.append({'icon': '🎯', 'name': '퀴즈 마스터'})
+
+    # 📚 북웜: 논문 공유 5회 이상
+    if paper_count >= 5:
+        badges.append({'icon': '📚', 'name': '북웜'})
+
+    # 🥇 골드 러너: 6챕터 이상 완료
+    if data['total_completed'] >= 6:
+        badges.append({'icon': '🥇', 'name': '골드 러너'})
+
+    # 🔥 불꽃 학습자: 3챕터 이상 완료
+    if data['total_completed'] >= 3:
+        badges.append({'icon': '🔥', 'name': '불꽃 학습자'})
+
+
+    # 레벨 계산
+    if total_score >= 150:
+        level = "🏆 그랜드 마스터"
+        level_color = "#FFD700"
+    elif total_score >= 100:
+        level = "💎 마스터"
+        level_color = "#C0C0C0"
+    elif total_score >= 70:
+        level = "⭐ 전문가"
+        level_color = "#CD7F32"
+    elif total_score >= 40:
+        level = "🔥 열정적인 학습자"
+        level_color = "#FF6B6B"
+    else:
+        level = "🌱 초보 학습자"
+        level_color = "#51CF66"
+
+    return {
+        'name': name,
+        'repo_name': repo_name,
+        'total_score': total_score,
+        'chapter_score': chapter_score,
+        'quiz_score': quiz_score,
+        'paper_score': paper_score,
+        'quiz_count': quiz_count,
+        'paper_count': paper_count,
+        'badges': badges,
+        'level': level,
+        'level_color': level_color,
+        'chapters_completed': data['total_completed'],
+    }
+
+
+class ScoreIndex:
+    """점수 내림차순 정렬 인덱스 (동점은 tiebreak 오름차순)
+
+    항목 갱신은 이분 탐색으로 위치를 찾아 교체하고, 상위 k개 조회는 O(k)
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._key_by_member = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def update(self, member, score, tiebreak):
+        old_key = self._key_by_member.get(member)
+        if old_key is not None:
+            del self._keys[bisect_left(self._keys, old_key)]
+        key = (-score, tiebreak, member)
+        insort(self._keys, key)
+        self._key_by_member[member] = key
+
+    def clear(self):
+        self._keys = []
+        self._key_by_member = {}
+
+    def top(self, limit=None):
+        """[(member, score), ...] 점수순"""
+        keys = self._keys if limit is None else self._keys[:limit]
+        return [(member, -negative_score) for negative_score, _, member in keys]
+
+
+# 미리 정렬해 둔 리더보드와 퀴즈별 완료자 인덱스 (쓰기 API 와 스냅샷 갱신 시 해당 항목만 갱신)
+# 다른 워커의 쓰기를 반영하도록 LEADERBOARD_TTL 마다 Supabase 에서 다시 적재
+# 퀴즈 인덱스는 GitHub 스냅샷과 무관하게 적재 (퀴즈 API 는 GitHub 를 기다리지 않음)
+leaderboard_state = {
+    'quiz_loaded_at': None,
+    'papers_loaded_at': None,
+    'submission_version': None,
+    'quiz_pairs': set(),
+    'quiz_users': {},
+    'quiz_stats': None,
+    'quiz_counts': {},
+    'paper_counts': {},
+    'quiz_index': ScoreIndex(),
+    'local_last_id': 0,
+    'ranking_entries': {},
+    'ranking_order': {},
+    'ranking_index': ScoreIndex(),
+    'lock': threading.RLock(),
+}
+LEADERBOARD_TTL = int(os.getenv('LEADERBOARD_TTL', '300'))
+
+def update_ranking_entry(repo_name, data):
+    """멤버 한 명의 랭킹 항목을 다시 계산해 인덱스에 반영"""
+    state = leaderboard_state
+    entry = build_ranking_entry(
+        repo_name, data,
+        state['quiz_counts'].get(data['name'], 0),
+        state['paper_counts'].get(data['name'], 0),
+    )
+    state['ranking_entries'][repo_name] = entry
+    state['ranking_index'].update(repo_name, entry['total_score'], state['ranking_order'][repo_name])
+
+def reset_ranking():
+    """퀴즈 / 논문 수를 다시 적재했으면 랭킹 항목을 다음 조회 때 전부 다시 계산"""
+    state = leaderboard_state
+    state['ranking_entries'] = {}
+    state['ranking_order'] = {}
+    state['ranking_index'].clear()
+    state['submission_version'] = None
+
+def sync_ranking_submissions(submissions):
+    """스냅샷이 바뀌었으면 완료 챕터 수가 달라진 멤버만 다시 계산"""
+    state = leaderboard_state
+    version = get_snapshot_version(submissions)
+    if version is not None and state['submission_version'] == version and len(state['ranking_entries']) == len(submissions):
+        return
+
+    if list(state['ranking_order']) != list(submissions):
+        state['ranking_order'] = {repo_name: order for order, repo_name in enumerate(submissions)}
+        state['ranking_entries'] = {}
+        state['ranking_index'].clear()
+
+    for repo_name, data in submissions.items():
+        entry = state['ranking_entries'].get(repo_name)
+        if entry is None or entry['chapters_completed'] != data['total_completed'] or entry['name'] != data['name']:
+            update_ranking_entry(repo_name, data)
+
+    state['submission_version'] = version
+
+def add_quiz_pair(user_name, quiz_id):
+    """(멤버, 퀴즈) 완료 1건을 퀴즈 인덱스에 추가, 이미 있으면 False
+
+    완료 수는 행 수가 아니라 서로 다른 (멤버, 퀴즈) 쌍의 수 - 같은 퀴즈는 한 번만 인정하므로
+    중복 행이 있어도 전체 재적재와 증분 반영의 결과가 같음
+    완료자 목록과 리더보드 동점 순서도 도착 순서가 아니라 이름순이라 두 경로의 결과가 같음
+    """
+    state = leaderboard_state
+    if (user_name, quiz_id) in state['quiz_pairs']:
+        return False
+    state['quiz_pairs'].add((user_name, quiz_id))
+    insort(state['quiz_users'].setdefault(quiz_id, []), user_name)
+    state['quiz_counts'][user_name] = state['quiz_counts'].get(user_name, 0) + 1
+    return True
+
+def load_quiz_index():
+    """원본에서 퀴즈 완료 인덱스 재적재 (Supabase, 없으면 로컬 저장소)
+
+    Supabase 를 쓸 때도 로컬 저장소는 같은 호스트 워커들이 공유하는 완료 기록 로그로 쓰므로,
+    적재 시점의 마지막 id 를 기억해 두고 그 이후 기록만 이어 읽음
+    """
+    state = leaderboard_state
+    if supabase:
+        # Supabase 를 읽기 전에 기억해야 그 사이에 들어온 기록도 놓치지 않음 (중복은 add_quiz_pair 가 건너뜀)
+        try:
+            state['local_last_id'] = get_local_quiz_last_id()
+        except Exception as e:
+            print(f"[WARNING] 로컬 퀴즈 로그 확인 실패: {str(e)}")
+        # (user_name, quiz_id) 가 같은 행은 어차피 한 번만 세므로 이 두 컬럼 순서면 페이지 경계가 안정적
+        quiz_rows = fetch_all_rows(
+            lambda: supabase.table('quiz_completions').select('user_name, quiz_id'), ['user_name', 'quiz_id']
+        )
+        if QUIZ_WRITE_BEHIND['enabled']:
+            # 아직 flush 되지 않은 완료 기록도 포함 (이미 반영된 쌍은 add_quiz_pair 가 건너뜀)
+            quiz_rows = quiz_rows + [
+                {'user_name': user_name, 'quiz_id': quiz_id}
+                for _, user_name, quiz_id, _ in read_pending_quiz_rows()
+            ]
+    else:
+        local_rows = read_local_quiz_rows()
+        quiz_rows = [{'user_name': user_name, 'quiz_id': quiz_id} for _, user_name, quiz_id in local_rows]
+        state['local_last_id'] = local_rows[-1][0] if local_rows else 0
+
+    state['quiz_pairs'] = set()
+    state['quiz_users'] = {}
+    state['quiz_stats'] = None
+    state['quiz_counts'] = {}
+    state['quiz_index'].clear()
+    for record in quiz_rows:
+        add_quiz_pair(record['user_name'], record['quiz_id'])
+    for user_name, count in state['quiz_counts'].items():
+        state['quiz_index'].update(user_name, count, user_name)
+
+    state['quiz_loaded_at'] = time.time()
+    reset_ranking()
+
+def ensure_quiz_index():
+    """퀴즈 인덱스가 비었거나 TTL 이 지났으면 재적재, 아니면 변경분만 반영
+
+    같은 호스트의 다른 워커가 추가한 기록은 로컬 저장소에서 id 기준으로 이어 읽으므로
+    TTL 을 기다리지 않고 바로 보임 (TTL 재적재는 다른 호스트의 기록을 위한 것)
+    """
+    state = leaderboard_state
+    if state['quiz_loaded_at'] is None or time.time() - state['quiz_loaded_at'] >= LEADERBOARD_TTL:
+        try:
+            load_quiz_index()
+            return
+        except Exception as e:
+            print(f"[ERROR] 퀴즈 인덱스 적재 실패: {str(e)}")
+
+    if state['quiz_loaded_at'] is not None:
+        try:
+            for row_id, user_name, quiz_id in read_local_quiz_rows(state['local_last_id']):
+                record_quiz_completion(user_name, quiz_id)
+                state['local_last_id'] = row_id
+        except Exception as e:
+            print(f"[WARNING] 로컬 퀴즈 로그 읽기 실패: {str(e)}")
+
+def ensure_leaderboard(submissions):
+    """종합 랭킹용 - 퀴즈 인덱스 / 논문 수를 준비하고 스냅샷 변경분만 반영"""
+    state = leaderboard_state
+    ensure_quiz_index()
+
+    if state['papers_loaded_at'] is None or time.time() - state['papers_loaded_at'] >= LEADERBOARD_TTL:
+        try:
+            state['paper_counts'] = count_by_field('papers', 'author') if supabase else {}
+            state['papers_loaded_at'] = time.time()
+            reset_ranking()
+        except Exception as e:
+            print(f"[ERROR] 논문 수 적재 실패: {str(e)}")
+
+    sync_ranking_submissions(submissions)
+
+def find_member_repo(user_name):
+    """이름으로 레포 이름 찾기"""
+    for repo_name, person_name in REPO_NAME_MAPPING.items():
+        if person_name == user_name:
+            return repo_name
+    return None
+
+def record_quiz_completion(user_name, quiz_id):
+    """퀴즈 완료 1건을 리더보드에 반영 (이미 완료한 퀴즈면 변화 없음)"""
+    state = leaderboard_state
+    with state['lock']:
+        if state['quiz_loaded_at'] is None or not add_quiz_pair(user_name, quiz_id):
+            return
+        state['quiz_stats'] = None
+        state['quiz_index'].update(user_name, state['quiz_counts'][user_name], user_name)
+
+        repo_name = find_member_repo(user_name)
+        submissions = cache['submissions'] or {}
+        if repo_name in state['ranking_entries'] and repo_name in submissions:
+            update_ranking_entry(repo_name, submissions[repo_name])
+
+def record_paper(author):
+    """논문 1건 등록을 리더보드에 반영"""
+    state = leaderboard_state
+    with state['lock']:
+        if state['papers_loaded_at'] is None:
+            return
+        state['paper_counts'][author] = state['paper_counts'].get(author, 0) + 1
+
+        repo_name = find_member_repo(author)
+        submissions = cache['submissions'] or {}
+        if repo_name in state['ranking_entries'] and repo_name in submissions:
+            update_ranking_entry(repo_name, submissions[repo_name])
+
+def get_rankings(limit=None):
+    """종합 랭킹 상위 limit 명 (동점은 같은 순위, 다음 순위는 건너뜀)"""
+    submissions = fetch_all_submissions()
+    state = leaderboard_state
+    with state['lock']:
+        ensure_leaderboard(submissions)
+        rankings = []
+        current_rank = 0
+        prev_score = None
+        for idx, (repo_name, score) in enumerate(state['ranking_index'].top(limit), start=1):
+            if score != prev_score:
+                current_rank = idx
+                prev_score = score
+            rankings.append(dict(state['ranking_entries'][repo_name], rank=current_rank))
+        return rankings
+
+def get_quiz_stats():
+    """퀴즈별 완료자 통계 (완료 기록이 바뀔 때까지 캐시, GitHub 스냅샷 불필요)"""
+    state = leaderboard_state
+    with state['lock']:
+        ensure_quiz_index()
+        if state['quiz_loaded_at'] is None:
+            raise RuntimeError('퀴즈 완료 기록을 불러오지 못했습니다')
+        if state['quiz_stats'] is None:
+            stats = {}
+            for quiz_list in QUIZZES.values():
+                for quiz in quiz_list:
+                    completed_users = list(state['quiz_users'].get(quiz['id'], []))
+                    stats[quiz['id']] = {
+                        'completed': len(completed_users),
+                        'users': completed_users
+                    }
+            state['quiz_stats'] = stats
+        return state['quiz_stats']
+
+def get_quiz_leaderboard(limit=None):
+    """퀴즈 완료 수 상위 limit 명 [(이름, 완료 수), ...] (GitHub 스냅샷 불필요)"""
+    state = leaderboard_state
+    with state['lock']:
+        ensure_quiz_index()
+        return state['quiz_index'].top(limit)
+
+def group_top_ranks(rankings):
+    """TOP 3 순위별 그룹 생성"""
     top_ranks = {}
     for rank_data in rankings:
         rank = rank_data['rank']
@@ -1478,6 +3127,13 @@ def ranking():
             if rank not in top_ranks:
                 top_ranks[rank] = []
             top_ranks[rank].append(rank_data)
+    return top_ranks
+
+@app.route('/ranking')
+def ranking():
+    """종합 랭킹 페이지"""
+    rankings = get_rankings()
+    top_ranks = group_top_ranks(rankings)
     
     return render_template('ranking.html', 
                          rankings=rankings,
@@ -1498,12 +3154,14 @@ def portfolio():
     print(f"PART1_MEMBERS count: {len(PART1_MEMBERS)}")
     print(f"PART2_MEMBERS count: {len(PART2_MEMBERS)}")
     
+    all_skill_scores = get_all_skill_scores(submissions)
+
     # Part1 멤버
     part1_members = []
     for repo_name in PART1_MEMBERS:
         if repo_name in submissions:
             data = submissions[repo_name]
-            skill_scores = calculate_skill_scores_detailed(data)
+            skill_scores = all_skill_scores[repo_name]
             avg_skill = sum(skill_scores.values()) / len(skill_scores) if skill_scores else 0
             
             part1_members.append({
@@ -1522,7 +3180,7 @@ def portfolio():
     for repo_name in PART2_MEMBERS:
         if repo_name in submissions:
             data = submissions[repo_name]
-            skill_scores = calculate_skill_scores_detailed(data)
+            skill_scores = all_skill_scores[repo_name]
             avg_skill = sum(skill_scores.values()) / len(skill_scores) if skill_scores else 0
             
             part2_members.append({
@@ -1549,7 +3207,9 @@ def portfolio_detail(repo_name):
     if repo_name not in submissions:
         return "사용자를 찾을 수 없습니다", 404
     
-    profile = get_detailed_learning_profile(repo_name, submissions[repo_name])
+    profile = get_detailed_learning_profile(
+        repo_name, submissions[repo_name], get_all_skill_scores(submissions)[repo_name]
+    )
     
     # 퀴즈 완료 개수
     quiz_count = 0
@@ -1602,9 +3262,11 @@ def skill_comparison():
     """전체 스터디원 스킬 비교 API"""
     submissions = fetch_all_submissions()
     
+    all_skill_scores = get_all_skill_scores(submissions)
+
     comparison_data = []
     for repo_name, data in submissions.items():
-        skill_scores = calculate_skill_scores_detailed(data)
+        skill_scores = all_skill_scores[repo_name]
         comparison_data.append({
             'name': data['name'],
             'repo_name': repo_name,
@@ -1782,24 +3444,40 @@ def study_projects_page():
 @app.route('/study-projects/<int:project_id>')
 def study_project_detail_page(project_id):
     """스터디 프로젝트 상세 페이지"""
-    return render_template('study_project_detail.html', project_id=project_id)
+    return render_template('study_project_detail.html', project_id=project_id,
+                           project_events_enabled=PROJECT_EVENTS_ENABLED)
+
+def compute_study_project_list():
+    """프로젝트 목록 + 참여자 수 (프로젝트 수와 관계없이 일정한 쿼리 수, 참여자는 max-rows 단위로 페이지)"""
+    projects = supabase.table('study_projects').select('*').order('created_at', desc=True).execute().data
+    project_ids = [project['id'] for project in projects]
+
+    participant_counts = dict.fromkeys(project_ids, 0)
+    if project_ids:
+        participants = fetch_all_rows(
+            lambda: supabase.table('project_participants').select('id, project_id').in_('project_id', project_ids), ['id']
+        )
+        for participant in participants:
+            participant_counts[participant['project_id']] += 1
+
+    for project in projects:
+        project['participant_count'] = participant_counts[project['id']]
+    return projects
 
 # API 엔드포인트들
 @app.route('/api/study-projects', methods=['GET'])
 def get_study_projects():
-    """스터디 프로젝트 목록 조회"""
+    """스터디 프로젝트 목록 조회 (프로젝트 / 참여자 변경 시 다시 계산)
+
+    버전은 워커 간 공유되므로 다른 워커에서 생성 / 수정한 직후에도 새 목록을 반환
+    """
     if not supabase:
         return jsonify([]), 500
     
     try:
-        response = supabase.table('study_projects').select('*').order('created_at', desc=True).execute()
-        
-        projects = []
-        for project in response.data:
-            participants_response = supabase.table('project_participants').select('user_name').eq('project_id', project['id']).execute()
-            project['participant_count'] = len(participants_response.data)
-            projects.append(project)
-        
+        projects = get_cached_aggregate(
+            'study_project_list', get_shared_version('study_projects'), compute_study_project_list, AGGREGATE_TTL
+        )
         return jsonify(projects)
     except Exception as e:
         print(f"[ERROR] 스터디 프로젝트 목록 조회 실패: {e}")
@@ -1825,6 +3503,7 @@ def create_study_project():
         }
         
         response = supabase.table('study_projects').insert(project_data).execute()
+        bump_shared_version('study_projects')
         return jsonify({'success': True, 'project': response.data[0]})
     except Exception as e:
         print(f"[ERROR] 스터디 프로젝트 생성 실패: {e}")
@@ -1859,6 +3538,8 @@ def update_study_project(project_id):
         print(f"[DEBUG] 프로젝트 수정 데이터: {update_data}")
         
         response = supabase.table('study_projects').update(update_data).eq('id', project_id).execute()
+        bump_shared_version('study_projects')
+        bump_study_project_version(project_id)
         
         if not response.data:
             return jsonify({'error': '프로젝트를 찾을 수 없습니다'}), 404
@@ -1881,59 +3562,147 @@ def delete_study_project(project_id):
     try:
         # CASCADE 설정으로 관련 데이터(참여자, 참관인, 회고록)도 자동 삭제됨
         response = supabase.table('study_projects').delete().eq('id', project_id).execute()
+        bump_shared_version('study_projects')
+        bump_study_project_version(project_id)
         return jsonify({'success': True})
     except Exception as e:
         print(f"[ERROR] 프로젝트 삭제 실패: {e}")
         return jsonify({'error': str(e)}), 500
+# 상세 조회의 독립적인 쿼리 4개를 동시에 실행하는 풀
+study_detail_executor = ThreadPoolExecutor(max_workers=int(os.getenv('STUDY_DETAIL_WORKERS', '8')), thread_name_prefix='study-detail')
+
+def bump_study_project_version(project_id):
+    """프로젝트 상세 캐시 무효화 (워커 간 공유 버전이라 다른 워커의 캐시도 함께 무효화)"""
+    bump_shared_version(f'study_project:{project_id}')
+
+# 프로젝트별 실시간 이벤트 (SSE) - 최근 이벤트를 버퍼에 남겨 재연결 시 Last-Event-ID 이후부터 다시 보냄
+# 열린 스트림마다 워커 스레드를 하나씩 점유하므로 gthread / gevent 워커에서만 켤 것
+# (gunicorn 기본 sync 워커에서는 탭 몇 개로 모든 워커가 묶임)
+PROJECT_EVENTS_ENABLED = os.getenv('PROJECT_EVENTS_ENABLED', '0') == '1'
+PROJECT_EVENT_BUFFER = 200
+PROJECT_STREAM_KEEPALIVE = 15
+PROJECT_STREAM_MAX_SUBSCRIBERS = int(os.getenv('PROJECT_STREAM_MAX_SUBSCRIBERS', '500'))
+
+project_streams = {
+    'lock': threading.Lock(),
+    'channels': {},
+    'subscribers': 0,
+}
+
+def get_project_channel(project_id):
+    """프로젝트 이벤트 채널 {'condition', 'events', 'last_id'} (없으면 생성)"""
+    with project_streams['lock']:
+        channel = project_streams['channels'].get(project_id)
+        if channel is None:
+            channel = project_streams['channels'][project_id] = {
+                'condition': threading.Condition(),
+                'events': deque(maxlen=PROJECT_EVENT_BUFFER),
+                'last_id': 0,
+            }
+        return channel
+
+def publish_project_event(project_id, event_type, data):
+    """프로젝트 구독자에게 이벤트 전송 (해당 프로젝트 구독자만 깨움)"""
+    if not PROJECT_EVENTS_ENABLED:
+        return
+    channel = get_project_channel(project_id)
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    with channel['condition']:
+        channel['last_id'] += 1
+        channel['events'].append((channel['last_id'], event_type, payload))
+        channel['condition'].notify_all()
+
+def format_sse(event_id, event_type, payload):
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+def stream_project_events(project_id, last_id):
+    """last_id 이후 이벤트를 기다렸다가 전송, 한동안 없으면 keepalive 주석
+
+    버퍼에 남아 있지 않은 구간을 요청하면 reset 이벤트로 전체 재조회를 요청
+    """
+    channel = get_project_channel(project_id)
+    condition = channel['condition']
+    with project_streams['lock']:
+        project_streams['subscribers'] += 1
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            with condition:
+                condition.wait_for(lambda: channel['last_id'] != last_id, timeout=PROJECT_STREAM_KEEPALIVE)
+                current_id = channel['last_id']
+                events = [event for event in channel['events'] if event[0] > last_id]
+
+            if current_id == last_id:
+                yield ": keepalive\n\n"
+                continue
+
+            if last_id > current_id or not events or events[0][0] != last_id + 1:
+                yield format_sse(current_id, 'reset', '{}')
+            else:
+                for event_id, event_type, payload in events:
+                    yield format_sse(event_id, event_type, payload)
+            last_id = current_id
+    finally:
+        with project_streams['lock']:
+            project_streams['subscribers'] -= 1
+
+def compute_study_project_detail(project_id):
+    """프로젝트 / 참여자 / 참관인 / 회고록을 동시에 조회해 상세 문서 구성 (없는 프로젝트면 None)"""
+    project_future = study_detail_executor.submit(
+        lambda: supabase.table('study_projects').select('*').eq('id', project_id).execute()
+    )
+    # 참여자 / 참관인 / 회고록 정보 (deleted_at 필터 제거)
+    participants_future = study_detail_executor.submit(
+        lambda: supabase.table('project_participants').select('*').eq('project_id', project_id).execute()
+    )
+    observers_future = study_detail_executor.submit(
+        lambda: supabase.table('project_observers').select('*').eq('project_id', project_id).execute()
+    )
+    retro_future = study_detail_executor.submit(
+        lambda: supabase.table('project_retrospectives').select('*').eq('project_id', project_id).order('created_at', desc=False).execute()
+    )
+
+    project_response = project_future.result()
+    participants_response = participants_future.result()
+    observers_response = observers_future.result()
+    retro_response = retro_future.result()
+
+    if not project_response.data:
+        return None
+
+    project = project_response.data[0]
+    project['participants'] = participants_response.data
+    project['observers'] = observers_response.data
+
+    retrospectives = {
+        'GOOD': [],
+        'BAD': [],
+        'IDEAS': [],
+        'ACTION': []
+    }
+
+    for retro in retro_response.data:
+        category = retro['category']
+        if category in retrospectives:
+            retrospectives[category].append(retro)
+
+    project['retrospectives'] = retrospectives
+    return project
+
 @app.route('/api/study-projects/<int:project_id>', methods=['GET'])
 def get_study_project_detail(project_id):
-    """스터디 프로젝트 상세 정보 조회"""
+    """스터디 프로젝트 상세 정보 조회 (프로젝트의 공유 버전이 바뀔 때만 다시 조회)"""
     if not supabase:
         return jsonify({'error': 'Supabase 연결 실패'}), 500
     
     try:
-        # 프로젝트 기본 정보
-        project_response = supabase.table('study_projects').select('*').eq('id', project_id).execute()
-        if not project_response.data:
+        project = get_cached_aggregate(
+            f'study_project:{project_id}', get_shared_version(f'study_project:{project_id}'),
+            lambda: compute_study_project_detail(project_id), AGGREGATE_TTL
+        )
+        if project is None:
             return jsonify({'error': '프로젝트를 찾을 수 없습니다'}), 404
         
-        project = project_response.data[0]
-        
-        # 참여자 정보 (deleted_at 필터 제거)
-        participants_response = supabase.table('project_participants')\
-            .select('*')\
-            .eq('project_id', project_id)\
-            .execute()
-        project['participants'] = participants_response.data
-        
-        # 참관인 정보 (deleted_at 필터 제거)
-        observers_response = supabase.table('project_observers')\
-            .select('*')\
-            .eq('project_id', project_id)\
-            .execute()
-        project['observers'] = observers_response.data
-        
-        # 회고록 정보 (deleted_at 필터 제거)
-        retro_response = supabase.table('project_retrospectives')\
-            .select('*')\
-            .eq('project_id', project_id)\
-            .order('created_at', desc=False)\
-            .execute()
-        
-        retrospectives = {
-            'GOOD': [],
-            'BAD': [],
-            'IDEAS': [],
-            'ACTION': []
-        }
-        
-        for retro in retro_response.data:
-            category = retro['category']
-            if category in retrospectives:
-                retrospectives[category].append(retro)
-        
-        project['retrospectives'] = retrospectives
-        
         return jsonify(project)
     except Exception as e:
         print(f"[ERROR] 스터디 프로젝트 상세 조회 실패: {e}")
@@ -1942,6 +3711,24 @@ def get_study_project_detail(project_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/study-projects/<int:project_id>/events')
+def study_project_events(project_id):
+    """회고록 / 참여자 / 참관인 변경 이벤트 스트림 (Server-Sent Events, PROJECT_EVENTS_ENABLED=1 일 때만)"""
+    if not PROJECT_EVENTS_ENABLED:
+        return jsonify({'error': '실시간 이벤트가 꺼져 있습니다'}), 404
+    if project_streams['subscribers'] >= PROJECT_STREAM_MAX_SUBSCRIBERS:
+        return jsonify({'error': '구독자가 너무 많습니다'}), 503
+
+    channel = get_project_channel(project_id)
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    last_id = int(last_event_id) if last_event_id.isdigit() else channel['last_id']
+
+    return Response(
+        stream_project_events(project_id, last_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/study-projects/<int:project_id>/retrospectives/deleted', methods=['GET'])
 def get_deleted_retrospectives(project_id):
     """삭제된 회고록 조회"""
@@ -1986,6 +3773,9 @@ def restore_retrospective(project_id, retro_id):
         }
         
         response = supabase.table('project_retrospectives').update(update_data).eq('id', retro_id).execute()
+        bump_study_project_version(project_id)
+        if response.data:
+            publish_project_event(project_id, 'retro_restored', {'retrospective': response.data[0]})
         
         return jsonify({'success': True})
     except Exception as e:
@@ -2008,6 +3798,9 @@ def add_study_participant(project_id):
         }
         
         response = supabase.table('project_participants').insert(participant_data).execute()
+        bump_shared_version('study_projects')
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'participant_added', {'participant': response.data[0]})
         return jsonify({'success': True, 'participant': response.data[0]})
     except Exception as e:
         print(f"[ERROR] 참여자 추가 실패: {e}")
@@ -2023,6 +3816,9 @@ def delete_study_participant(project_id, participant_id):
     
     try:
         response = supabase.table('project_participants').delete().eq('id', participant_id).execute()
+        bump_shared_version('study_projects')
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'participant_deleted', {'id': participant_id})
         return jsonify({'success': True})
     except Exception as e:
         print(f"[ERROR] 참여자 삭제 실패: {e}")
@@ -2045,6 +3841,8 @@ def add_observer(project_id):
         print(f"[DEBUG] 참관인 추가 데이터: {observer_data}")
         
         response = supabase.table('project_observers').insert(observer_data).execute()
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'observer_added', {'observer': response.data[0]})
         return jsonify({'success': True, 'observer': response.data[0]})
     except Exception as e:
         print(f"[ERROR] 참관인 추가 실패: {e}")
@@ -2061,6 +3859,8 @@ def delete_observer(project_id, observer_id):
     
     try:
         response = supabase.table('project_observers').delete().eq('id', observer_id).execute()
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'observer_deleted', {'id': observer_id})
         return jsonify({'success': True})
     except Exception as e:
         print(f"[ERROR] 참관인 삭제 실패: {e}")
@@ -2092,6 +3892,8 @@ def add_study_retrospective(project_id):
         }
         
         response = supabase.table('project_retrospectives').insert(retro_data).execute()
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'retro_added', {'retrospective': response.data[0]})
         return jsonify({'success': True, 'retrospective': response.data[0]})
     except Exception as e:
         print(f"[ERROR] 회고록 추가 실패: {e}")
@@ -2105,6 +3907,8 @@ def delete_study_retrospective(project_id, retro_id):
     
     try:
         response = supabase.table('project_retrospectives').delete().eq('id', retro_id).execute()
+        bump_study_project_version(project_id)
+        publish_project_event(project_id, 'retro_deleted', {'id': retro_id})
         return jsonify({'success': True})
     except Exception as e:
         print(f"[ERROR] 회고록 삭제 실패: {e}")
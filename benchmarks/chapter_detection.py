@@ -0,0 +1,50 @@
+"""detect_chapter_from_filename 성능 측정
+
+기존 구현(패턴 10개를 순서대로 re.search)과 현재 구현의 처리 시간을 비교
+골든 비교는 tests/test_chapter_detection.py (pytest) 에서 확인
+사용법: python benchmarks/chapter_detection.py [반복 횟수]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+from tests.test_chapter_detection import build_corpus, legacy_detect_chapter_from_filename
+
+
+def measure(func, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for filename in corpus:
+            func(filename)
+    return time.perf_counter() - started
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    corpus = build_corpus()
+
+    legacy = measure(legacy_detect_chapter_from_filename, corpus, repeat)
+
+    compiled = measure(app.detect_chapter_from_filename.__wrapped__, corpus, repeat)
+
+    # 한 번의 스캔에서 다시 보는 파일명 규모 (LRU 캐시 크기 이내)
+    scan_sample = corpus[:2000]
+    app.detect_chapter_from_filename.cache_clear()
+    measure(app.detect_chapter_from_filename, scan_sample, 1)
+    cached = measure(app.detect_chapter_from_filename, scan_sample, repeat)
+
+    calls = len(corpus) * repeat
+    print(f"기존 구현          : {legacy / calls * 1e6:6.2f} us/건")
+    print(f"컴파일 패턴        : {compiled / calls * 1e6:6.2f} us/건")
+    print(f"컴파일 패턴 + LRU  : {cached / (len(scan_sample) * repeat) * 1e6:6.2f} us/건 (재조회)")
+
+
+if __name__ == '__main__':
+    main()
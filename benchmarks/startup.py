@@ -0,0 +1,52 @@
+"""app.py import 부터 첫 응답까지 걸리는 시간 측정
+
+매 회 새 파이썬 프로세스에서 측정 (gunicorn 워커 부팅과 같은 조건)
+사용법: python benchmarks/startup.py [반복 횟수]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = r'''
+import json
+import time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+response = app.app.test_client().get('/api/users')
+responded = time.perf_counter()
+print("RESULT " + json.dumps({
+    'import': imported - started,
+    'first_response': responded - started,
+    'status': response.status_code,
+}))
+'''
+
+
+def run_once():
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):])
+    raise RuntimeError(output)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = [run_once() for _ in range(runs)]
+
+    for key in ('import', 'first_response'):
+        values = [result[key] * 1000 for result in results]
+        print(f"{key:>15}: median {statistics.median(values):7.1f} ms  "
+              f"(min {min(values):.1f}, max {max(values):.1f}, n={runs})")
+
+
+if __name__ == '__main__':
+    main()
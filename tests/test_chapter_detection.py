@@ -0,0 +1,79 @@
+"""detect_chapter_from_filename 골든 비교
+
+기존 구현(패턴 10개를 순서대로 re.search)과 같은 답을 내는지 파일명 코퍼스 전체에 대해 확인
+"""
+import itertools
+import re
+
+import app
+
+
+def legacy_detect_chapter_from_filename(filename):
+    """변경 전 구현 (골든 기준)"""
+    filename = filename.split('/')[-1]
+    filename_lower = filename.lower()
+    filename_clean = ''.join(
+        c for c in filename_lower
+        if not ('가' <= c <= '힣')
+    )
+    patterns = [
+        r'ch[_\-\s]?(\d{2})',
+        r'chapter[_\-\s]?(\d{2})',
+        r'ch[_\-\s]?([1-9])(?![0-9])',
+        r'chapter[_\-\s]?([1-9])(?![0-9])',
+        r'chap[_\-\s]?(\d{2})',
+        r'chap[_\-\s]?([1-9])(?![0-9])',
+        r'week[_\-\s]?(\d{2})',
+        r'week[_\-\s]?([1-9])(?![0-9])',
+        r'^(\d{1,2})[_\-\s]',
+        r'^(\d{1,2})\.',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, filename_clean)
+        if match:
+            num = int(match.group(1))
+            if 1 <= num <= 10:
+                return f'ch{num:02d}'
+    return None
+
+
+def build_corpus():
+    """실제 제출 파일명 형태를 조합한 코퍼스"""
+    prefixes = ['ch', 'Ch', 'CH', 'chapter', 'Chapter', 'chap', 'week', 'Week', '', '혼공머신_ch', '과제']
+    separators = ['', '_', '-', ' ', '.']
+    numbers = ['0', '1', '01', '2', '05', '09', '10', '11', '12', '3', '7', '99', '100']
+    suffixes = ['', '_실습', '-1', '_2', ' 과제', '_final', '(1)', '_v2_ch03', 'week4']
+    extensions = ['.ipynb', '.py']
+    folders = ['', 'ch03/', 'notebooks/week2/']
+
+    corpus = [
+        f"{folder}{prefix}{sep}{num}{suffix}{ext}"
+        for folder, prefix, sep, num, suffix, ext in itertools.product(
+            folders, prefixes, separators, numbers, suffixes, extensions
+        )
+    ]
+    corpus += [
+        'README.md', 'main.py', 'utils.py', '혼자공부하는머신러닝.ipynb',
+        'ch11_ch02.ipynb', 'week3_ch05.ipynb', '3.ipynb', '10-회귀.ipynb',
+        'chapter_ten.ipynb', 'chch1.ipynb', 'ch\n02.ipynb', 'ch١٢.ipynb',
+    ]
+    return corpus
+
+
+def test_matches_legacy_implementation():
+    app.detect_chapter_from_filename.cache_clear()
+    mismatches = [
+        (filename, expected, actual)
+        for filename in build_corpus()
+        for expected, actual in [(legacy_detect_chapter_from_filename(filename),
+                                  app.detect_chapter_from_filename(filename))]
+        if expected != actual
+    ]
+
+    assert mismatches == []
+
+
+def test_cached_result_matches_uncached():
+    app.detect_chapter_from_filename.cache_clear()
+    for filename in build_corpus():
+        assert app.detect_chapter_from_filename(filename) == app.detect_chapter_from_filename.__wrapped__(filename)
@@ -0,0 +1,65 @@
+"""퀴즈 인덱스 증분 반영 / 전체 재적재 결과 비교"""
+import random
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def quiz_state(monkeypatch):
+    monkeypatch.setattr(app_module, 'supabase', None)
+    state = app_module.leaderboard_state
+    for key, value in {
+        'quiz_loaded_at': None,
+        'quiz_pairs': set(),
+        'quiz_users': {},
+        'quiz_stats': None,
+        'quiz_counts': {},
+        'quiz_index': app_module.ScoreIndex(),
+        'local_last_id': 0,
+        'ranking_entries': {},
+        'ranking_order': {},
+        'ranking_index': app_module.ScoreIndex(),
+        'submission_version': None,
+    }.items():
+        monkeypatch.setitem(state, key, value)
+    return state
+
+
+def load_from_rows(monkeypatch, rows):
+    local_rows = [(index + 1, user_name, quiz_id) for index, (user_name, quiz_id) in enumerate(rows)]
+    monkeypatch.setattr(app_module, 'read_local_quiz_rows', lambda after_id=0: local_rows)
+    app_module.load_quiz_index()
+
+
+def test_incremental_matches_reload(monkeypatch, quiz_state):
+    rng = random.Random(3)
+    names = list(app_module.REPO_NAME_MAPPING.values())[:12]
+    quiz_ids = [quiz['id'] for quiz_list in app_module.QUIZZES.values() for quiz in quiz_list]
+    completions = [(rng.choice(names), rng.choice(quiz_ids)) for _ in range(150)]
+
+    load_from_rows(monkeypatch, [])
+    for user_name, quiz_id in completions:
+        app_module.record_quiz_completion(user_name, quiz_id)
+    incremental_top = quiz_state['quiz_index'].top()
+    incremental_users = {quiz_id: list(users) for quiz_id, users in quiz_state['quiz_users'].items()}
+
+    # Supabase 재적재처럼 (user_name, quiz_id) 순서로, 중복 행 포함
+    load_from_rows(monkeypatch, sorted(completions + completions[:20]))
+
+    assert quiz_state['quiz_index'].top() == incremental_top
+    assert quiz_state['quiz_users'] == incremental_users
+    assert incremental_top == sorted(
+        quiz_state['quiz_counts'].items(), key=lambda item: (-item[1], item[0])
+    )
+
+
+def test_duplicate_completion_is_counted_once(monkeypatch, quiz_state):
+    load_from_rows(monkeypatch, [])
+    name = list(app_module.REPO_NAME_MAPPING.values())[0]
+
+    app_module.record_quiz_completion(name, 'quiz-a')
+    app_module.record_quiz_completion(name, 'quiz-a')
+
+    assert quiz_state['quiz_index'].top() == [(name, 1)]
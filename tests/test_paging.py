@@ -0,0 +1,127 @@
+"""Supabase 페이지 조회 / 정렬 인덱스 검사
+
+PostgREST 는 한 번에 max-rows(기본 1000) 행까지만 돌려주므로
+fetch_all_rows 가 그보다 많은 행을 빠짐없이, 중복 없이 모으는지 확인
+"""
+import random
+
+import pytest
+
+import app as app_module
+
+MAX_ROWS = 1000
+
+
+class CappedQuery:
+    """select / order / range / execute 만 흉내 내는 조회 (max-rows 초과분은 잘라서 반환)"""
+
+    def __init__(self, table):
+        self.table = table
+        self.columns = None
+        self.order_columns = []
+        self.bounds = None
+
+    def select(self, columns):
+        self.columns = [column.strip() for column in columns.split(',')]
+        return self
+
+    def order(self, column):
+        self.order_columns.append(column)
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def execute(self):
+        rows = self.table.rows
+        if self.order_columns:
+            rows = sorted(rows, key=lambda row: tuple(row[column] for column in self.order_columns))
+        if self.bounds is not None:
+            start, end = self.bounds
+            rows = rows[start:end + 1]
+        rows = rows[:MAX_ROWS]
+        self.table.requests += 1
+        data = [{column: row[column] for column in self.columns} for row in rows]
+        return type('Response', (), {'data': data})()
+
+
+class CappedTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = 0
+
+
+class CappedClient:
+    def __init__(self, tables):
+        self.tables = {name: CappedTable(rows) for name, rows in tables.items()}
+
+    def table(self, name):
+        return CappedQuery(self.tables[name])
+
+
+def make_rows(count):
+    rng = random.Random(count)
+    rows = [
+        {'id': index + 1, 'user_name': f'user{rng.randrange(40)}', 'quiz_id': f'q{rng.randrange(60)}'}
+        for index in range(count)
+    ]
+    rng.shuffle(rows)
+    return rows
+
+
+@pytest.mark.parametrize('count', [0, 1, MAX_ROWS - 1, MAX_ROWS, MAX_ROWS + 1, 2 * MAX_ROWS + 345])
+def test_fetch_all_rows_collects_past_max_rows(monkeypatch, count):
+    monkeypatch.setattr(app_module, 'SUPABASE_PAGE_SIZE', MAX_ROWS)
+    client = CappedClient({'quiz_completions': make_rows(count)})
+
+    rows = app_module.fetch_all_rows(lambda: client.table('quiz_completions').select('id, user_name'), ['id'])
+
+    assert [row['id'] for row in rows] == list(range(1, count + 1))
+    assert client.tables['quiz_completions'].requests == count // MAX_ROWS + 1
+
+
+def test_fetch_all_rows_with_smaller_pages(monkeypatch):
+    monkeypatch.setattr(app_module, 'SUPABASE_PAGE_SIZE', 300)
+    client = CappedClient({'quiz_completions': make_rows(2500)})
+
+    rows = app_module.fetch_all_rows(
+        lambda: client.table('quiz_completions').select('id, user_name, quiz_id'), ['user_name', 'quiz_id', 'id']
+    )
+
+    assert len(rows) == 2500
+    assert sorted(row['id'] for row in rows) == list(range(1, 2501))
+
+
+def test_count_by_field_counts_every_row(monkeypatch):
+    source = make_rows(3 * MAX_ROWS + 7)
+    monkeypatch.setattr(app_module, 'SUPABASE_PAGE_SIZE', MAX_ROWS)
+    monkeypatch.setattr(app_module, 'supabase', CappedClient({'quiz_completions': source}))
+
+    expected = {}
+    for row in source:
+        expected[row['user_name']] = expected.get(row['user_name'], 0) + 1
+
+    assert app_module.count_by_field('quiz_completions', 'user_name') == expected
+
+
+def test_score_index_incremental_matches_rebuild():
+    rng = random.Random(7)
+    members = [f'member{index:02d}' for index in range(50)]
+    index = app_module.ScoreIndex()
+    scores = {}
+
+    for _ in range(2000):
+        member = rng.choice(members)
+        scores[member] = scores.get(member, 0) + rng.choice([1, 1, 1, -1, 0])
+        index.update(member, scores[member], member)
+
+        rebuilt = app_module.ScoreIndex()
+        for name, score in scores.items():
+            rebuilt.update(name, score, name)
+
+        assert index.top() == rebuilt.top()
+        assert index.top(5) == rebuilt.top(5)
+
+    assert index.top() == sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    assert len(index) == len(scores)
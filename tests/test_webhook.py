@@ -0,0 +1,94 @@
+import hashlib
+import hmac
+import json
+from pathlib import Path
+
+import pytest
+
+import app as app_module
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'push_event.json'
+SECRET = 'test-secret'
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, 'GITHUB_WEBHOOK_SECRET', SECRET)
+    monkeypatch.setattr(app_module, 'SUBMISSION_SNAPSHOT_FILE', str(tmp_path / 'submission_snapshot.json'))
+    monkeypatch.setattr(app_module, 'start_client_health_checks', lambda: None)
+    monkeypatch.setitem(app_module.cache, 'submissions', None)
+    monkeypatch.setitem(app_module.cache, 'last_updated', 0)
+    monkeypatch.setitem(app_module.cache, 'version', 0)
+    monkeypatch.setitem(app_module.cache, 'snapshot_mtime', None)
+    monkeypatch.setitem(app_module.cache, 'repo_markers', {})
+    return app_module.app.test_client()
+
+
+def post_push(client):
+    body = FIXTURE.read_bytes()
+    signature = 'sha256=' + hmac.new(SECRET.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return client.post('/webhooks/github', data=body, headers={
+        'X-GitHub-Event': 'push',
+        'X-Hub-Signature-256': signature,
+        'Content-Type': 'application/json',
+    })
+
+
+def test_push_without_snapshot_is_ignored(client):
+    response = post_push(client)
+
+    assert response.status_code == 202
+    assert response.get_json()['ignored'] == 'snapshot'
+    assert app_module.cache['submissions'] is None
+    assert not Path(app_module.SUBMISSION_SNAPSHOT_FILE).exists()
+
+
+def test_push_updates_only_pushed_row(client):
+    submissions = {
+        repo_name: app_module.create_empty_submission_row(name)
+        for repo_name, name in app_module.REPO_NAME_MAPPING.items()
+    }
+    app_module.publish_submissions(submissions)
+
+    response = post_push(client)
+
+    assert response.status_code == 200
+    assert response.get_json()['repo_name'] == 'hayoung-kim'
+    assert len(app_module.cache['submissions']) == len(app_module.REPO_NAME_MAPPING)
+    assert app_module.cache['submissions']['hayoung-kim']['chapters']['ch03'] is True
+    assert app_module.cache['submissions']['minjeong-ko']['total_completed'] == 0
+
+    with open(app_module.SUBMISSION_SNAPSHOT_FILE, encoding='utf-8') as f:
+        assert len(json.load(f)['submissions']) == len(app_module.REPO_NAME_MAPPING)
+
+
+def test_push_with_bad_signature_is_rejected(client):
+    response = client.post('/webhooks/github', data=FIXTURE.read_bytes(), headers={
+        'X-GitHub-Event': 'push',
+        'X-Hub-Signature-256': 'sha256=' + '0' * 64,
+    })
+
+    assert response.status_code == 403
+
+
+def test_push_during_scan_is_deferred(client):
+    submissions = {
+        repo_name: app_module.create_empty_submission_row(name)
+        for repo_name, name in app_module.REPO_NAME_MAPPING.items()
+    }
+    app_module.publish_submissions(submissions)
+
+    # 다른 워커가 전체 스캔 중인 상황
+    lock_file = app_module.acquire_snapshot_lock()
+    try:
+        response = post_push(client)
+        assert response.status_code == 202
+        assert response.get_json()['deferred'] is True
+        assert app_module.cache['submissions']['hayoung-kim']['chapters']['ch03'] is False
+        drain_thread = app_module.pending_pushes['thread']
+    finally:
+        app_module.release_snapshot_lock(lock_file)
+
+    drain_thread.join(timeout=5)
+    assert app_module.cache['submissions']['hayoung-kim']['chapters']['ch03'] is True
+    assert app_module.pending_pushes['queue'] == []